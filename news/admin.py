@@ -2,7 +2,7 @@
 Admin configuration for news application models.
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin
 from .models import (
     User, Publisher, Category, Article, Newsletter, Subscription,
@@ -81,6 +81,7 @@ class ArticleAdmin(admin.ModelAdmin):
     search_fields = ('title', 'content', 'summary', 'author__username')
     ordering = ('-created_at',)
     readonly_fields = ('created_at', 'updated_at', 'approved_at')
+    actions = ('approve_selected',)
 
     fieldsets = (
         ('Article Information', {
@@ -110,6 +111,18 @@ class ArticleAdmin(admin.ModelAdmin):
             return qs.filter(author=request.user)
         return qs
 
+    @admin.action(description='Approve selected articles')
+    def approve_selected(self, request, queryset):
+        """Approve the selected articles in a single UPDATE."""
+        if not request.user.is_editor():
+            self.message_user(
+                request, 'Only editors can approve articles',
+                level=messages.ERROR
+            )
+            return
+        updated = Article.bulk_approve(queryset, request.user)
+        self.message_user(request, f'{updated} article(s) approved')
+
 
 @admin.register(Newsletter)
 class NewsletterAdmin(admin.ModelAdmin):
@@ -161,10 +174,12 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
     """
     Admin configuration for PasswordResetToken model.
     """
-    list_display = ('user', 'token', 'created_at', 'is_used', 'is_valid')
+    list_display = (
+        'user', 'created_at', 'expires_at', 'is_used', 'is_valid'
+    )
     list_filter = ('is_used', 'created_at')
-    search_fields = ('user__username', 'user__email', 'token')
-    readonly_fields = ('token', 'created_at', 'is_valid')
+    search_fields = ('user__username', 'user__email')
+    readonly_fields = ('token_hash', 'created_at', 'expires_at', 'is_valid')
 
     def is_valid(self, obj):
         """Display if token is valid."""
@@ -11,6 +11,8 @@ urlpatterns = [
     # Articles
     path('articles/', api_views.ArticleListAPIView.as_view(),
          name='article-list'),
+    path('articles/bulk/', api_views.bulk_create_articles_api,
+         name='article-bulk-create'),
     path('articles/<int:pk>/', api_views.ArticleDetailAPIView.as_view(),
          name='article-detail'),
     path('articles/<int:pk>/approve/', api_views.approve_article_api,
@@ -2,19 +2,66 @@
 REST API views for news application.
 """
 
+import hashlib
+
 from rest_framework import generics, status, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db.models import Count, Max, Q
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag, urlencode
+from .cache_keys import article_list_version
 from .models import Article, Publisher, Category, Newsletter, Subscription
 from .serializers import (
     ArticleSerializer, ArticleListSerializer, PublisherSerializer,
     CategorySerializer, NewsletterSerializer, SubscriptionSerializer
 )
 
+# Seconds a user's article list fingerprint is reused before re-querying
+ARTICLE_ETAG_TTL = 1
+# Seconds a rendered article list is kept; a changed ETag changes its key
+ARTICLE_LIST_CACHE_TTL = 300
+
+
+def article_etag_key(user):
+    """
+    Return the cache key for a user's article list fingerprint.
+
+    :param user: User the article list is filtered for
+    :type user: User
+    :return: Cache key
+    :rtype: str
+    """
+    return f'news:articles:etag:{user.pk}'
+
 
-class ArticleListAPIView(generics.ListCreateAPIView):
+class SerializerPrefetchMixin:
+    """
+    View mixin that joins the relations rendered by the serializer.
+
+    The role-filtered queryset is passed through the serializer's
+    ``prefetch_queryset`` so list and detail responses load nested
+    objects in the same query.
+    """
+
+    def filter_queryset(self, queryset):
+        """
+        Filter the queryset and join the serializer's relations.
+
+        :param queryset: Queryset returned by ``get_queryset``
+        :type queryset: QuerySet
+        :return: Queryset joined to the serializer's related fields
+        :rtype: QuerySet
+        """
+        queryset = super().filter_queryset(queryset)
+        return self.get_serializer_class().prefetch_queryset(queryset)
+
+
+class ArticleListAPIView(SerializerPrefetchMixin,
+                         generics.ListCreateAPIView):
     """
     API view for listing and creating articles with role-based filtering.
 
@@ -66,7 +113,7 @@ class ArticleListAPIView(generics.ListCreateAPIView):
                     Q(publisher__in=subscribed_publishers) |
                     Q(author__in=subscribed_journalists)
                 )
-            ).select_related('author', 'publisher', 'category')
+            )
 
         elif user.is_journalist():
             # Journalists see their own articles
@@ -80,6 +127,82 @@ class ArticleListAPIView(generics.ListCreateAPIView):
 
         return Article.objects.none()
 
+    def get_etag(self):
+        """
+        Return an ETag fingerprinting the current user's article list.
+
+        The fingerprint combines the number of visible articles with their
+        latest ``updated_at``, so edits, additions and removals all change
+        it. It is cached for ``ARTICLE_ETAG_TTL`` seconds to keep polling
+        cheap. The list version, bumped when a related author, publisher or
+        category changes, is mixed in uncached.
+
+        :return: Quoted ETag value
+        :rtype: str
+        """
+        user = self.request.user
+        stats = cache.get_or_set(
+            article_etag_key(user),
+            lambda: self.get_queryset().aggregate(
+                count=Count('pk'), latest=Max('updated_at')
+            ),
+            ARTICLE_ETAG_TTL
+        )
+        fingerprint = (
+            f"{article_list_version()}:{user.pk}:{user.role}:"
+            f"{stats['count']}:{stats['latest']}"
+        )
+        return quote_etag(hashlib.md5(
+            fingerprint.encode(), usedforsecurity=False
+        ).hexdigest())
+
+    def list(self, request, *args, **kwargs):
+        """
+        List articles, answering 304 when the client's copy is current.
+
+        JSON bodies are cached under the ETag and query string, so a
+        client without a matching copy still skips the query and
+        serialization while the list is unchanged.
+        """
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None and request.accepted_renderer.format == 'json':
+            key = self.get_list_cache_key(etag)
+            cached = cache.get(key)
+            if cached is None:
+                response = super().list(request, *args, **kwargs)
+                response.accepted_renderer = request.accepted_renderer
+                response.accepted_media_type = request.accepted_media_type
+                response.renderer_context = self.get_renderer_context()
+                cached = (response.rendered_content, response['Content-Type'])
+                cache.set(key, cached, ARTICLE_LIST_CACHE_TTL)
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+        elif response is None:
+            response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Authorization', 'Cookie'))
+        return response
+
+    def get_list_cache_key(self, etag):
+        """
+        Return the cache key for a rendered article list response.
+
+        The negotiated media type is included, as its parameters (such as
+        ``indent``) change the rendered body.
+
+        :param etag: ETag of the current article list
+        :type etag: str
+        :return: Cache key combining the ETag, media type and query string
+        :rtype: str
+        """
+        query = urlencode(sorted(self.request.GET.lists()), doseq=True)
+        media_type = self.request.accepted_media_type
+        digest = hashlib.md5(
+            f'{etag}:{media_type}:{query}'.encode(), usedforsecurity=False
+        ).hexdigest()
+        return f'news:articles:list:{digest}'
+
     def perform_create(self, serializer):
         """
         Set the author to the current user.
@@ -88,9 +211,11 @@ class ArticleListAPIView(generics.ListCreateAPIView):
             serializer: Article serializer instance
         """
         serializer.save(author=self.request.user)
+        cache.delete(article_etag_key(self.request.user))
 
 
-class ArticleDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class ArticleDetailAPIView(SerializerPrefetchMixin,
+                           generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting articles.
     """
@@ -133,7 +258,8 @@ class CategoryListAPIView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
 
-class NewsletterListAPIView(generics.ListCreateAPIView):
+class NewsletterListAPIView(SerializerPrefetchMixin,
+                            generics.ListCreateAPIView):
     """
     API view for listing and creating newsletters.
     """
@@ -173,7 +299,8 @@ class NewsletterListAPIView(generics.ListCreateAPIView):
         serializer.save(author=self.request.user)
 
 
-class SubscriptionListAPIView(generics.ListCreateAPIView):
+class SubscriptionListAPIView(SerializerPrefetchMixin,
+                              generics.ListCreateAPIView):
     """
     API view for listing and creating subscriptions.
     """
@@ -193,7 +320,8 @@ class SubscriptionListAPIView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
-class SubscriptionDetailAPIView(generics.RetrieveDestroyAPIView):
+class SubscriptionDetailAPIView(SerializerPrefetchMixin,
+                                generics.RetrieveDestroyAPIView):
     """
     API view for retrieving and deleting subscriptions.
     """
@@ -235,6 +363,35 @@ def approve_article_api(request, pk):
     )
 
 
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_create_articles_api(request):
+    """
+    API endpoint for creating many articles at once (journalists only).
+
+    The request body is a list of article payloads. They are validated
+    together and written with batched multi-row INSERTs. The response
+    reports how many articles were created.
+    """
+    if not request.user.is_journalist():
+        return Response(
+            {'error': 'Only journalists can create articles'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    serializer = ArticleSerializer(data=request.data, many=True)
+    serializer.is_valid(raise_exception=True)
+    articles = serializer.save(author=request.user)
+    cache.delete(article_etag_key(request.user))
+
+    # Backends without can_return_rows_from_bulk_insert (MySQL) leave the
+    # primary keys of bulk_create rows unset, so serializing them would
+    # return "id": null. Report the count instead.
+    return Response(
+        {'created': len(articles)}, status=status.HTTP_201_CREATED
+    )
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def user_subscriptions_api(request):
@@ -257,7 +414,9 @@ def user_subscriptions_api(request):
     # Get subscribed journalists
     journalist_subscriptions = Subscription.objects.filter(
         user=user, journalist__isnull=False
-    ).select_related('journalist')
+    ).select_related(None).select_related('journalist').only(
+        'journalist__username', 'journalist__email'
+    )
 
     # Get articles from subscriptions
     subscribed_publishers = publisher_subscriptions.values_list(
@@ -269,7 +428,7 @@ def user_subscriptions_api(request):
         Q(publisher__in=subscribed_publishers) |
         Q(author__in=subscribed_journalists),
         status='published'
-    ).select_related('author', 'publisher', 'category')
+    )
 
     # Serialize data
     publisher_data = PublisherSerializer(
@@ -285,7 +444,7 @@ def user_subscriptions_api(request):
         for sub in journalist_subscriptions
     ]
 
-    article_data = ArticleListSerializer(articles, many=True).data
+    article_data = ArticleListSerializer.values_data(articles)
 
     return Response({
         'publishers': publisher_data,
@@ -13,4 +13,6 @@ class NewsConfig(AppConfig):
 
     def ready(self):
         import news.signals  # noqa: F401
+        from news.serializers import CachedFieldsMixin
+        CachedFieldsMixin.warm_fields_cache()
 
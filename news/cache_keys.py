@@ -0,0 +1,54 @@
+"""
+Cache keys and version counters shared by views and signal receivers.
+"""
+
+from django.core.cache import cache
+
+ARTICLE_LIST_VERSION_KEY = 'news:articles:version'
+# Form dropdown options, invalidated by the receivers in news.signals
+PUBLISHER_CHOICES_KEY = 'news:choices:publisher'
+CATEGORY_CHOICES_KEY = 'news:choices:category'
+JOURNALIST_CHOICES_VERSION_KEY = 'news:choices:journalist:version'
+
+
+def article_list_version():
+    """
+    Return the version counter mixed into every article list ETag.
+
+    :return: Current version
+    :rtype: int
+    """
+    return cache.get_or_set(ARTICLE_LIST_VERSION_KEY, 1, None)
+
+
+def bump_article_list_version():
+    """
+    Invalidate article list ETags and cached bodies by bumping the version.
+
+    Edits to the nested author, publisher or category do not touch an
+    article's ``updated_at``, so their signal receivers call this instead.
+    """
+    cache.add(ARTICLE_LIST_VERSION_KEY, 1, None)
+    cache.incr(ARTICLE_LIST_VERSION_KEY)
+
+
+def journalist_choices_key():
+    """
+    Return the cache key for the current journalist dropdown options.
+
+    The key embeds a version counter that is bumped whenever journalists
+    change, so stale option lists are simply never read again.
+
+    :return: Versioned cache key
+    :rtype: str
+    """
+    version = cache.get_or_set(JOURNALIST_CHOICES_VERSION_KEY, 1, None)
+    return f'news:choices:journalist:{version}'
+
+
+def bump_journalist_choices_version():
+    """
+    Invalidate cached journalist options by bumping their version.
+    """
+    cache.add(JOURNALIST_CHOICES_VERSION_KEY, 1, None)
+    cache.incr(JOURNALIST_CHOICES_VERSION_KEY)
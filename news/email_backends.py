@@ -0,0 +1,85 @@
+"""
+Email backends for news application.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+
+logger = logging.getLogger(__name__)
+
+_outbox = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _deliver():
+    """
+    Send queued messages with ``EMAIL_QUEUE_BACKEND`` until stopped.
+    """
+    while True:
+        messages = _outbox.get()
+        try:
+            if messages is None:
+                return
+            get_connection(settings.EMAIL_QUEUE_BACKEND).send_messages(
+                messages
+            )
+        except Exception:
+            logger.exception('Error sending queued email')
+        finally:
+            _outbox.task_done()
+
+
+def _stop():
+    """
+    Deliver any queued messages and stop the worker thread.
+    """
+    if _worker is not None:
+        _outbox.put(None)
+        _worker.join(timeout=10)
+
+
+def flush():
+    """
+    Block until every queued message has been handed to the backend.
+    """
+    _outbox.join()
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    """
+    Email backend that delivers messages from a background thread.
+
+    ``send_messages`` only queues the messages and returns, so views and
+    signal handlers do not wait on SMTP. A single worker thread sends them
+    with the backend named by ``EMAIL_QUEUE_BACKEND``. Delivery errors are
+    logged rather than raised, as the caller has already moved on.
+    """
+
+    def send_messages(self, email_messages):
+        """
+        Queue messages for background delivery.
+
+        :param email_messages: Messages to send
+        :type email_messages: list
+        :return: Number of messages queued
+        :rtype: int
+        """
+        global _worker
+        if not email_messages:
+            return 0
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(
+                    target=_deliver, name='email-outbox', daemon=True
+                )
+                _worker.start()
+                atexit.register(_stop)
+        _outbox.put(list(email_messages))
+        return len(email_messages)
@@ -2,12 +2,86 @@
 Forms for news application with validation and user-friendly interfaces.
 """
 
+import hmac
+from types import MappingProxyType
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
+from django.core.cache import cache
+from .cache_keys import (
+    PUBLISHER_CHOICES_KEY, CATEGORY_CHOICES_KEY, journalist_choices_key
+)
 from .models import (
     User, Article, Publisher, Category, Newsletter, Subscription
 )
 
+# Shared Bootstrap widget attributes; widgets copy attrs on construction
+FORM_CONTROL = MappingProxyType({'class': 'form-control'})
+
+# Dropdown options change rarely, so the (pk, label) pairs are cached for a
+# short time and invalidated by the receivers in news.signals.
+CHOICES_CACHE_TTL = 60
+JOURNALIST_CHOICES_TTL = 3600
+
+
+def _cached_choices(field, key, ttl=CHOICES_CACHE_TTL):
+    """
+    Populate a model choice field's options from the cache.
+
+    On a cache miss the field's own queryset and ``label_from_instance``
+    build the (pk, label) pairs, so rendering the dropdown does not query
+    the database while the entry is warm. Submitted values are still
+    validated against ``field.queryset``.
+
+    :param field: Model choice field to populate
+    :type field: ModelChoiceField
+    :param key: Cache key holding the (pk, label) pairs
+    :type key: str
+    :param ttl: Cache timeout in seconds, defaults to CHOICES_CACHE_TTL
+    :type ttl: int, optional
+    """
+    choices = cache.get(key)
+    if choices is None:
+        choices = [
+            (obj.pk, field.label_from_instance(obj))
+            for obj in field.queryset
+        ]
+        cache.set(key, choices, ttl)
+    if field.empty_label is not None:
+        choices = [('', field.empty_label)] + choices
+    field.choices = choices
+
+
+class FastModelChoiceField(forms.ModelChoiceField):
+    """
+    Model choice field that loads only the primary key and label column.
+
+    Dropdowns only need a value and a label, so the queryset is narrowed
+    with ``only()`` and labels are read straight from ``label_attr``
+    instead of going through the model's ``__str__``.
+
+    :param queryset: Queryset providing the available options
+    :type queryset: QuerySet
+    :param label_attr: Model field used as the option label,
+        defaults to 'name'
+    :type label_attr: str, optional
+    """
+
+    def __init__(self, queryset, label_attr='name', **kwargs):
+        self.label_attr = label_attr
+        super().__init__(queryset=queryset.only('pk', label_attr), **kwargs)
+
+    def label_from_instance(self, obj):
+        """
+        Return the option label for a model instance.
+
+        :param obj: Model instance being rendered as an option
+        :type obj: Model
+        :return: Value of the configured label attribute
+        :rtype: str
+        """
+        return getattr(obj, self.label_attr)
+
 
 class UserRegistrationForm(UserCreationForm):
     """
@@ -28,18 +102,18 @@ class UserRegistrationForm(UserCreationForm):
     """
     role = forms.ChoiceField(
         choices=User.ROLE_CHOICES,
-        widget=forms.Select(attrs={'class': 'form-control'})
+        widget=forms.Select(attrs=FORM_CONTROL)
     )
     email = forms.EmailField(
-        widget=forms.EmailInput(attrs={'class': 'form-control'})
+        widget=forms.EmailInput(attrs=FORM_CONTROL)
     )
     first_name = forms.CharField(
         max_length=30,
-        widget=forms.TextInput(attrs={'class': 'form-control'})
+        widget=forms.TextInput(attrs=FORM_CONTROL)
     )
     last_name = forms.CharField(
         max_length=30,
-        widget=forms.TextInput(attrs={'class': 'form-control'})
+        widget=forms.TextInput(attrs=FORM_CONTROL)
     )
 
     class Meta:
@@ -60,9 +134,8 @@ class UserRegistrationForm(UserCreationForm):
         and password fields for consistent styling.
         """
         super().__init__(*args, **kwargs)
-        self.fields['username'].widget.attrs.update({'class': 'form-control'})
-        self.fields['password1'].widget.attrs.update({'class': 'form-control'})
-        self.fields['password2'].widget.attrs.update({'class': 'form-control'})
+        for name in ('username', 'password1', 'password2'):
+            self.fields[name].widget.attrs.update(FORM_CONTROL)
 
 
 class ArticleForm(forms.ModelForm):
@@ -84,6 +157,17 @@ class ArticleForm(forms.ModelForm):
     :param category: Category selection dropdown
     :type category: ModelChoiceField
     """
+    publisher = FastModelChoiceField(
+        Publisher.objects.all(),
+        required=False,
+        widget=forms.Select(attrs=FORM_CONTROL)
+    )
+    category = FastModelChoiceField(
+        Category.objects.all(),
+        required=False,
+        widget=forms.Select(attrs=FORM_CONTROL)
+    )
+
     class Meta:
         """
         Meta options for ArticleForm.
@@ -94,33 +178,30 @@ class ArticleForm(forms.ModelForm):
         ]
         widgets = {
             'title': forms.TextInput(attrs={
-                'class': 'form-control',
+                **FORM_CONTROL,
                 'placeholder': 'Enter article title'
             }),
             'content': forms.Textarea(attrs={
-                'class': 'form-control',
+                **FORM_CONTROL,
                 'rows': 10,
                 'placeholder': 'Enter article content'
             }),
             'summary': forms.Textarea(attrs={
-                'class': 'form-control',
+                **FORM_CONTROL,
                 'rows': 3,
                 'placeholder': 'Enter article summary (optional)'
             }),
-            'publisher': forms.Select(attrs={'class': 'form-control'}),
-            'category': forms.Select(attrs={'class': 'form-control'}),
         }
 
     def __init__(self, *args, **kwargs):
         """
-        Initialize form with querysets for publisher and category fields.
+        Initialize form with cached publisher and category options.
 
-        This method sets up the querysets for the publisher and category
-        dropdown fields to ensure they display all available options.
+        The rendered dropdown options are served from the choices cache.
         """
         super().__init__(*args, **kwargs)
-        self.fields['publisher'].queryset = Publisher.objects.all()
-        self.fields['category'].queryset = Category.objects.all()
+        _cached_choices(self.fields['publisher'], PUBLISHER_CHOICES_KEY)
+        _cached_choices(self.fields['category'], CATEGORY_CHOICES_KEY)
 
 
 class ArticleApprovalForm(forms.ModelForm):
@@ -143,7 +224,7 @@ class ArticleApprovalForm(forms.ModelForm):
         model = Article
         fields = ['status', 'is_approved']
         widgets = {
-            'status': forms.Select(attrs={'class': 'form-control'}),
+            'status': forms.Select(attrs=FORM_CONTROL),
             'is_approved': forms.CheckboxInput(
                 attrs={'class': 'form-check-input'}),
         }
@@ -153,6 +234,12 @@ class NewsletterForm(forms.ModelForm):
     """
     Form for creating newsletters.
     """
+    publisher = FastModelChoiceField(
+        Publisher.objects.all(),
+        required=False,
+        widget=forms.Select(attrs=FORM_CONTROL)
+    )
+
     class Meta:
         """
         Meta options for NewsletterForm.
@@ -161,20 +248,19 @@ class NewsletterForm(forms.ModelForm):
         fields = ['title', 'content', 'publisher']
         widgets = {
             'title': forms.TextInput(attrs={
-                'class': 'form-control',
+                **FORM_CONTROL,
                 'placeholder': 'Enter newsletter title'
             }),
             'content': forms.Textarea(attrs={
-                'class': 'form-control',
+                **FORM_CONTROL,
                 'rows': 10,
                 'placeholder': 'Enter newsletter content'
             }),
-            'publisher': forms.Select(attrs={'class': 'form-control'}),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['publisher'].queryset = Publisher.objects.all()
+        _cached_choices(self.fields['publisher'], PUBLISHER_CHOICES_KEY)
 
 
 class SubscriptionForm(forms.ModelForm):
@@ -182,45 +268,42 @@ class SubscriptionForm(forms.ModelForm):
     Form for managing user subscriptions to publishers and journalists.
 
     This form allows users to subscribe to either publishers or journalists.
-    It includes validation to ensure only one type of subscription is selected
-    and provides a clean interface for subscription management.
+    The model's ``subscription_exactly_one_target`` constraint is validated
+    by the form, ensuring exactly one type of subscription is selected.
 
     :param publisher: Publisher selection dropdown for subscription
     :type publisher: ModelChoiceField
     :param journalist: Journalist selection dropdown for subscription
     :type journalist: ModelChoiceField
     """
+    publisher = FastModelChoiceField(
+        Publisher.objects.all(),
+        required=False,
+        widget=forms.Select(attrs=FORM_CONTROL)
+    )
+    journalist = FastModelChoiceField(
+        User.objects.filter(
+            role=User.ROLE_JOURNALIST
+        ).order_by('username'),
+        label_attr='username',
+        required=False,
+        widget=forms.Select(attrs=FORM_CONTROL)
+    )
+
     class Meta:
         """
         Meta options for SubscriptionForm.
         """
         model = Subscription
         fields = ['publisher', 'journalist']
-        widgets = {
-            'publisher': forms.Select(attrs={'class': 'form-control'}),
-            'journalist': forms.Select(attrs={'class': 'form-control'}),
-        }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['publisher'].queryset = Publisher.objects.all()
-        self.fields['journalist'].queryset = User.objects.filter(
-            role='journalist'
+        _cached_choices(self.fields['publisher'], PUBLISHER_CHOICES_KEY)
+        _cached_choices(
+            self.fields['journalist'], journalist_choices_key(),
+            ttl=JOURNALIST_CHOICES_TTL
         )
-        self.fields['publisher'].required = False
-        self.fields['journalist'].required = False
-
-    def clean(self):
-        cleaned_data = super().clean()
-        publisher = cleaned_data.get('publisher')
-        journalist = cleaned_data.get('journalist')
-
-        if not publisher and not journalist:
-            raise forms.ValidationError(
-                'You must subscribe to either a publisher or a journalist.'
-            )
-
-        return cleaned_data
 
 
 class SearchForm(forms.Form):
@@ -231,23 +314,28 @@ class SearchForm(forms.Form):
         max_length=100,
         required=False,
         widget=forms.TextInput(attrs={
-            'class': 'form-control',
+            **FORM_CONTROL,
             'placeholder': 'Search articles...'
         })
     )
-    category = forms.ModelChoiceField(
-        queryset=Category.objects.all(),
+    category = FastModelChoiceField(
+        Category.objects.all(),
         required=False,
         empty_label="All Categories",
-        widget=forms.Select(attrs={'class': 'form-control'})
+        widget=forms.Select(attrs=FORM_CONTROL)
     )
-    publisher = forms.ModelChoiceField(
-        queryset=Publisher.objects.all(),
+    publisher = FastModelChoiceField(
+        Publisher.objects.all(),
         required=False,
         empty_label="All Publishers",
-        widget=forms.Select(attrs={'class': 'form-control'})
+        widget=forms.Select(attrs=FORM_CONTROL)
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _cached_choices(self.fields['category'], CATEGORY_CHOICES_KEY)
+        _cached_choices(self.fields['publisher'], PUBLISHER_CHOICES_KEY)
+
 
 class ForgotPasswordForm(forms.Form):
     """
@@ -256,7 +344,7 @@ class ForgotPasswordForm(forms.Form):
     email = forms.EmailField(
         max_length=254,
         widget=forms.EmailInput(attrs={
-            'class': 'form-control',
+            **FORM_CONTROL,
             'placeholder': 'Enter your email address'
         })
     )
@@ -269,13 +357,13 @@ class ResetPasswordForm(forms.Form):
     new_password1 = forms.CharField(
         min_length=8,
         widget=forms.PasswordInput(attrs={
-            'class': 'form-control',
+            **FORM_CONTROL,
             'placeholder': 'Enter new password'
         })
     )
     new_password2 = forms.CharField(
         widget=forms.PasswordInput(attrs={
-            'class': 'form-control',
+            **FORM_CONTROL,
             'placeholder': 'Confirm new password'
         })
     )
@@ -286,6 +374,8 @@ class ResetPasswordForm(forms.Form):
         password2 = cleaned_data.get('new_password2')
 
         if password1 and password2:
-            if password1 != password2:
+            # Constant-time comparison so timing reveals nothing
+            if not hmac.compare_digest(
+                    password1.encode(), password2.encode()):
                 raise forms.ValidationError("Passwords don't match")
         return cleaned_data
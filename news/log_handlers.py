@@ -0,0 +1,29 @@
+"""
+Logging handlers for news application.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedStreamHandler(QueueHandler):
+    """
+    Logging handler that writes records to a stream from a background thread.
+
+    Records are formatted by the calling thread and put on an in-memory
+    queue; a ``QueueListener`` thread writes them out, so request threads
+    never block on the stream's I/O lock.
+
+    :param stream: Stream to write to, defaults to ``sys.stderr``
+    :type stream: file-like object, optional
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(
+            self.queue, logging.StreamHandler(stream)
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
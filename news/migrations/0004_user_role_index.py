@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:25
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_article_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('reader', 'Reader'), ('editor', 'Editor'), ('journalist', 'Journalist')], db_index=True, default='reader', max_length=20, validators=[django.core.validators.MinLengthValidator(3)]),
+        ),
+    ]
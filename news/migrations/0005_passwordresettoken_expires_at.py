@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_expires_at(apps, schema_editor):
+    PasswordResetToken = apps.get_model('news', 'PasswordResetToken')
+    PasswordResetToken.objects.update(
+        expires_at=F('created_at') + timedelta(hours=24)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_user_role_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='passwordresettoken',
+            name='expires_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(set_expires_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='expires_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='passwordresettoken',
+            index=models.Index(fields=['is_used', 'expires_at'], name='reset_token_active_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_names(apps, schema_editor):
+    Article = apps.get_model('news', 'Article')
+    Publisher = apps.get_model('news', 'Publisher')
+    User = apps.get_model('news', 'User')
+    Article.objects.update(
+        author_username=Subquery(
+            User.objects.filter(pk=OuterRef('author_id')).values('username')[:1]
+        ),
+        publisher_name=Coalesce(
+            Subquery(
+                Publisher.objects.filter(
+                    pk=OuterRef('publisher_id')
+                ).values('name')[:1]
+            ),
+            Value('')
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_passwordresettoken_expires_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='author_username',
+            field=models.CharField(default='', editable=False, max_length=150),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='publisher_name',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(populate_names, migrations.RunPython.noop),
+    ]
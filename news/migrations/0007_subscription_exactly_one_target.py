@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_article_denormalized_names'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='subscription',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('journalist__isnull', True), ('publisher__isnull', False)), models.Q(('journalist__isnull', False), ('publisher__isnull', True)), _connector='OR'), name='subscription_exactly_one_target', violation_error_message='You must subscribe to either a publisher or a journalist.'),
+        ),
+    ]
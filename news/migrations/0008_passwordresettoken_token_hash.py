@@ -0,0 +1,47 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def hash_existing_tokens(apps, schema_editor):
+    PasswordResetToken = apps.get_model('news', 'PasswordResetToken')
+    for reset_token in PasswordResetToken.objects.all():
+        reset_token.token_hash = hashlib.sha256(
+            reset_token.token.encode()
+        ).hexdigest()
+        reset_token.save(update_fields=['token_hash'])
+
+
+def delete_reset_tokens(apps, schema_editor):
+    # Plain tokens cannot be recovered from their hashes, and the token
+    # column is re-added as NOT NULL, so unapplying drops the outstanding
+    # tokens. They are single-use and expire, so users just request anew.
+    PasswordResetToken = apps.get_model('news', 'PasswordResetToken')
+    PasswordResetToken.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_subscription_exactly_one_target'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='passwordresettoken',
+            name='token_hash',
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(hash_existing_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='token_hash',
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+        migrations.RemoveField(
+            model_name='passwordresettoken',
+            name='token',
+        ),
+        # Last, so on unapply it runs before the token column is re-added
+        migrations.RunPython(migrations.RunPython.noop, delete_reset_tokens),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0008_passwordresettoken_token_hash'),
+    ]
+
+    operations = [
+        # Create the composite indexes first: MySQL refuses to drop a
+        # foreign key's index unless another index covers the column
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', 'status', '-created_at'], name='art_author_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['approved_by', 'approved_at'], name='art_approver_idx'),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='approved_by',
+            field=models.ForeignKey(blank=True, db_index=False, limit_choices_to={'role': 'editor'}, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='approved_articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='author',
+            field=models.ForeignKey(db_index=False, limit_choices_to={'role': 'journalist'}, on_delete=django.db.models.deletion.CASCADE, related_name='authored_articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='subscriptions', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
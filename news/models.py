@@ -2,26 +2,47 @@
 News application models for managing users, articles, and publications.
 """
 
+import hashlib
+import secrets
+from datetime import timedelta
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinLengthValidator
+from django.dispatch import Signal
 from django.utils import timezone
 
+# Password reset tokens expire this long after they are issued
+PASSWORD_RESET_TOKEN_LIFETIME = timedelta(hours=24)
+
+# Rows fetched per round trip when streaming subscribers for fanout
+FANOUT_CHUNK_SIZE = 2000
+
+# Sent with the approved ``articles`` after ``Article.bulk_approve``, which
+# skips ``save()`` and so the ``post_save`` approval handlers
+articles_approved = Signal()
+
 
 class User(AbstractUser):
     """
     Custom user model with role-based fields.
     """
+    ROLE_READER = 'reader'
+    ROLE_EDITOR = 'editor'
+    ROLE_JOURNALIST = 'journalist'
     ROLE_CHOICES = [
-        ('reader', 'Reader'),
-        ('editor', 'Editor'),
-        ('journalist', 'Journalist'),
+        (ROLE_READER, 'Reader'),
+        (ROLE_EDITOR, 'Editor'),
+        (ROLE_JOURNALIST, 'Journalist'),
     ]
+    ROLE_DISPLAY = dict(ROLE_CHOICES)
 
     role = models.CharField(
         max_length=20,
         choices=ROLE_CHOICES,
-        default='reader',
+        default=ROLE_READER,
+        db_index=True,
         validators=[MinLengthValidator(3)]
     )
 
@@ -35,7 +56,7 @@ class User(AbstractUser):
         'self',
         related_name='subscribers',
         blank=True,
-        limit_choices_to={'role': 'journalist'}
+        limit_choices_to={'role': ROLE_JOURNALIST}
     )
 
     # Fields for journalists
@@ -51,7 +72,8 @@ class User(AbstractUser):
     )
 
     def __str__(self):
-        return f"{self.username} ({self.get_role_display()})"
+        role = self.ROLE_DISPLAY.get(self.role, self.role)
+        return f"{self.username} ({role})"
 
     def is_reader(self):
         """
@@ -60,7 +82,7 @@ class User(AbstractUser):
         :return: True if user role is 'reader', False otherwise
         :rtype: bool
         """
-        return self.role == 'reader'
+        return self.role == self.ROLE_READER
 
     def is_editor(self):
         """
@@ -69,7 +91,7 @@ class User(AbstractUser):
         :return: True if user role is 'editor', False otherwise
         :rtype: bool
         """
-        return self.role == 'editor'
+        return self.role == self.ROLE_EDITOR
 
     def is_journalist(self):
         """
@@ -78,7 +100,34 @@ class User(AbstractUser):
         :return: True if user role is 'journalist', False otherwise
         :rtype: bool
         """
-        return self.role == 'journalist'
+        return self.role == self.ROLE_JOURNALIST
+
+    def has_published_articles(self):
+        """
+        Check if user has authored any published article.
+
+        Runs an EXISTS query instead of loading the articles.
+
+        :return: True if at least one authored article is published
+        :rtype: bool
+        """
+        return self.authored_articles.filter(status='published').exists()
+
+    def recent_articles(self, limit=10):
+        """
+        Return the user's most recently created articles.
+
+        Only the columns needed to list or link the articles are loaded,
+        and the relations joined by the default manager are dropped.
+
+        :param limit: Maximum number of articles to return, defaults to 10
+        :type limit: int, optional
+        :return: QuerySet of at most ``limit`` articles
+        :rtype: QuerySet
+        """
+        return self.authored_articles.select_related(None).only(
+            'id', 'title', 'status', 'created_at'
+        ).order_by('-created_at')[:limit]
 
 
 class Publisher(models.Model):
@@ -113,12 +162,12 @@ class Publisher(models.Model):
     editors = models.ManyToManyField(
         User,
         related_name='publisher_editors',
-        limit_choices_to={'role': 'editor'}
+        limit_choices_to={'role': User.ROLE_EDITOR}
     )
     journalists = models.ManyToManyField(
         User,
         related_name='publisher_journalists',
-        limit_choices_to={'role': 'journalist'}
+        limit_choices_to={'role': User.ROLE_JOURNALIST}
     )
 
     class Meta:
@@ -149,6 +198,21 @@ class Category(models.Model):
         return self.name
 
 
+class ArticleManager(models.Manager):
+    """
+    Manager that joins the users, publisher and category of articles.
+
+    Listings read these relations for every row, so they are fetched with
+    the articles, including through reverse managers such as
+    ``publisher.articles``. Call ``select_related(None)`` before ``only()``
+    to drop the joins when the related rows are not needed.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'author', 'publisher', 'category', 'approved_by'
+        )
+
+
 class Article(models.Model):
     """
     Model representing a news article with approval workflow.
@@ -170,6 +234,12 @@ class Article(models.Model):
     :param publisher: Foreign key to Publisher, can be null for independent
         articles, defaults to None
     :type publisher: ForeignKey, optional
+    :param author_username: Copy of the author's username for listings,
+        kept in sync on save
+    :type author_username: str
+    :param publisher_name: Copy of the publisher's name for listings, empty
+        for independent articles, kept in sync on save
+    :type publisher_name: str
     :param category: Foreign key to Category for article classification,
         can be null, defaults to None
     :type category: ForeignKey, optional
@@ -204,11 +274,14 @@ class Article(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField()
     summary = models.TextField(max_length=500, blank=True)
+    # author and approved_by lookups are served by the composite indexes
+    # in Meta, so their single-column FK indexes are not created
     author = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         related_name='authored_articles',
-        limit_choices_to={'role': 'journalist'}
+        limit_choices_to={'role': User.ROLE_JOURNALIST},
+        db_index=False
     )
     publisher = models.ForeignKey(
         Publisher,
@@ -217,6 +290,11 @@ class Article(models.Model):
         null=True,
         blank=True
     )
+    # Denormalized so public listings can skip the user/publisher joins
+    author_username = models.CharField(max_length=150, editable=False)
+    publisher_name = models.CharField(
+        max_length=100, blank=True, editable=False
+    )
     category = models.ForeignKey(
         Category,
         on_delete=models.SET_NULL,
@@ -235,29 +313,85 @@ class Article(models.Model):
         null=True,
         blank=True,
         related_name='approved_articles',
-        limit_choices_to={'role': 'editor'}
+        limit_choices_to={'role': User.ROLE_EDITOR},
+        db_index=False
     )
     approved_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
 
+    objects = ArticleManager()
+
     class Meta:
         """
         Meta class for Article model.
         """
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['status', '-created_at'],
+                name='article_status_created_idx'
+            ),
+            models.Index(
+                fields=['publisher', 'status', '-created_at'],
+                name='article_pub_status_idx'
+            ),
+            models.Index(
+                fields=['author', '-created_at'],
+                name='article_author_created_idx'
+            ),
+            models.Index(
+                fields=['author', 'status', '-created_at'],
+                name='art_author_status_created_idx'
+            ),
+            models.Index(
+                fields=['approved_by', 'approved_at'],
+                name='art_approver_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        """
+        Save article, syncing the denormalized author and publisher names.
+
+        The names are refreshed on full saves and on partial saves that
+        touch ``author`` or ``publisher``.
+        """
+        update_fields = kwargs.get('update_fields')
+        if (update_fields is None or
+                {'author', 'publisher'} & set(update_fields)):
+            self.sync_denormalized_names()
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields, 'author_username', 'publisher_name'
+                }
+        super().save(*args, **kwargs)
+
+    def sync_denormalized_names(self):
+        """
+        Copy the author's username and publisher's name onto the article.
+
+        ``save()`` calls this automatically; code that writes articles
+        without ``save()``, such as ``bulk_create``, must call it itself.
+        """
+        if self.author_id is not None:
+            self.author_username = self.author.username
+        self.publisher_name = (
+            self.publisher.name if self.publisher_id is not None else ''
+        )
+
     def approve(self, editor):
         """
         Approve article by editor and update status to published.
 
         This method sets the article as approved, updates the status to
         'approved', records the approving editor and timestamp, then saves
-        the changes.
+        only the approval columns. ``post_save`` still fires so subscriber
+        notifications are sent.
 
         :param editor: User instance with editor role who approves the
             article
@@ -269,7 +403,60 @@ class Article(models.Model):
         self.status = 'approved'
         self.approved_by = editor
         self.approved_at = timezone.now()
-        self.save()
+        self.save(update_fields=[
+            'is_approved', 'status', 'approved_by', 'approved_at',
+            'updated_at'
+        ])
+
+    @classmethod
+    def bulk_approve(cls, articles, editor):
+        """
+        Approve a batch of articles with a single UPDATE statement.
+
+        Rows are moved to 'approved' like ``approve()``, then the
+        ``articles_approved`` signal is sent with the updated articles so
+        subscribers are notified and the articles published, as the
+        ``post_save`` handlers do for a single approval. Articles that are
+        already approved keep their original editor and timestamp.
+
+        :param articles: QuerySet of articles, or article primary keys,
+            to approve
+        :type articles: QuerySet or iterable of int
+        :param editor: User instance with editor role who approves the
+            articles
+        :type editor: User
+        :return: Number of articles updated
+        :rtype: int
+        """
+        if not isinstance(articles, models.QuerySet):
+            articles = cls.objects.filter(pk__in=articles)
+        pks = list(
+            articles.filter(is_approved=False).values_list('pk', flat=True)
+        )
+        if not pks:
+            return 0
+        now = timezone.now()
+        updated = cls.objects.filter(pk__in=pks, is_approved=False).update(
+            is_approved=True,
+            status='approved',
+            approved_by=editor,
+            approved_at=now,
+            updated_at=now
+        )
+        if updated:
+            # The timestamp singles out the rows this call approved
+            articles_approved.send(sender=cls, articles=list(
+                cls.objects.filter(pk__in=pks, approved_at=now)
+            ))
+        return updated
+
+
+class NewsletterManager(models.Manager):
+    """
+    Manager that joins the author and publisher of newsletters.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related('author', 'publisher')
 
 
 class Newsletter(models.Model):
@@ -303,7 +490,7 @@ class Newsletter(models.Model):
         User,
         on_delete=models.CASCADE,
         related_name='authored_newsletters',
-        limit_choices_to={'role': 'journalist'}
+        limit_choices_to={'role': User.ROLE_JOURNALIST}
     )
     publisher = models.ForeignKey(
         Publisher,
@@ -315,6 +502,8 @@ class Newsletter(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = NewsletterManager()
+
     class Meta:
         """
         Meta class for Newsletter model.
@@ -325,6 +514,19 @@ class Newsletter(models.Model):
         return self.title
 
 
+class SubscriptionManager(models.Manager):
+    """
+    Manager that joins subscription owners and targets by default.
+
+    Rendering a subscription reads its user and publisher or journalist,
+    so they are fetched with the subscription instead of one query each.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'user', 'publisher', 'journalist'
+        )
+
+
 class Subscription(models.Model):
     """
     Model for managing user subscriptions to publishers and journalists.
@@ -345,10 +547,12 @@ class Subscription(models.Model):
     :param created_at: Timestamp when subscription was created, auto-generated
     :type created_at: datetime
     """
+    # The (user, publisher) unique index already leads with user
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
-        related_name='subscriptions'
+        related_name='subscriptions',
+        db_index=False
     )
     publisher = models.ForeignKey(
         Publisher,
@@ -363,10 +567,12 @@ class Subscription(models.Model):
         null=True,
         blank=True,
         related_name='subscribed_to_journalist',
-        limit_choices_to={'role': 'journalist'}
+        limit_choices_to={'role': User.ROLE_JOURNALIST}
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SubscriptionManager()
+
     class Meta:
         """
         Meta class for Subscription model.
@@ -375,11 +581,89 @@ class Subscription(models.Model):
             ('user', 'publisher'),
             ('user', 'journalist')
         ]
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    Q(publisher__isnull=False, journalist__isnull=True) |
+                    Q(publisher__isnull=True, journalist__isnull=False)
+                ),
+                name='subscription_exactly_one_target',
+                violation_error_message=(
+                    'You must subscribe to either a publisher or a '
+                    'journalist.'
+                ),
+            ),
+        ]
 
     def __str__(self):
-        if self.publisher:
-            return f"{self.user} subscribes to {self.publisher}"
-        return f"{self.user} subscribes to {self.journalist}"
+        return f"{self.user} subscribes to {self.target}"
+
+    @property
+    def target(self):
+        """
+        Return the publisher or journalist this subscription points at.
+
+        :return: Subscribed publisher, or journalist when no publisher is set
+        :rtype: Publisher or User
+        """
+        if self.publisher_id is not None:
+            return self.publisher
+        return self.journalist
+
+    @classmethod
+    def bulk_subscribe(cls, user, target_ids, target_type):
+        """
+        Subscribe a user to many publishers or journalists at once.
+
+        All rows are written with a single multi-row INSERT; targets the
+        user is already subscribed to are skipped by the database.
+
+        :param user: User who is subscribing
+        :type user: User
+        :param target_ids: IDs of the publishers or journalists
+        :type target_ids: iterable of int
+        :param target_type: Either 'publisher' or 'journalist'
+        :type target_type: str
+        :raises ValueError: If target_type is not a subscription target
+        :return: Subscription instances passed to the INSERT
+        :rtype: list
+        """
+        if target_type not in ('publisher', 'journalist'):
+            raise ValueError(f"Unknown subscription target: {target_type}")
+        subscriptions = [
+            cls(user=user, **{f'{target_type}_id': target_id})
+            for target_id in target_ids
+        ]
+        return cls.objects.bulk_create(
+            subscriptions, batch_size=1000, ignore_conflicts=True
+        )
+
+    @classmethod
+    def subscriber_emails(cls, publisher_id=None, journalist_id=None):
+        """
+        Return distinct subscriber emails for a publisher and/or journalist.
+
+        Both subscription targets are matched in a single query, so fanout
+        code does not need one lookup per side.
+
+        :param publisher_id: ID of the subscribed publisher, defaults to None
+        :type publisher_id: int, optional
+        :param journalist_id: ID of the subscribed journalist, defaults to
+            None
+        :type journalist_id: int, optional
+        :return: QuerySet of distinct subscriber email addresses
+        :rtype: QuerySet
+        """
+        condition = Q()
+        if publisher_id is not None:
+            condition |= Q(publisher_id=publisher_id)
+        if journalist_id is not None:
+            condition |= Q(journalist_id=journalist_id)
+        if not condition:
+            return cls.objects.none().values_list('user__email', flat=True)
+        return cls.objects.filter(condition).values_list(
+            'user__email', flat=True
+        ).distinct()
 
 
 class PasswordResetToken(models.Model):
@@ -392,11 +676,14 @@ class PasswordResetToken(models.Model):
 
     :param user: Foreign key to User requesting password reset, required
     :type user: ForeignKey
-    :param token: Unique token string for password reset, maximum 100
-        characters, defaults to None
-    :type token: str
+    :param token_hash: SHA-256 hex digest of the token sent to the user;
+        the raw token itself is never stored
+    :type token_hash: str
     :param created_at: Timestamp when token was created, auto-generated
     :type created_at: datetime
+    :param expires_at: Timestamp after which the token is no longer valid,
+        set on first save
+    :type expires_at: datetime
     :param is_used: Boolean flag indicating if token has been used,
         defaults to False
     :type is_used: bool
@@ -404,8 +691,9 @@ class PasswordResetToken(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name='password_reset_tokens'
     )
-    token = models.CharField(max_length=100, unique=True)
+    token_hash = models.CharField(max_length=64, unique=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
 
     class Meta:
@@ -413,10 +701,75 @@ class PasswordResetToken(models.Model):
         Meta class for PasswordResetToken model.
         """
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['is_used', 'expires_at'],
+                name='reset_token_active_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"Password reset token for {self.user.username}"
 
+    @staticmethod
+    def hash_token(raw_token):
+        """
+        Hash a raw reset token for storage and lookup.
+
+        Args:
+            raw_token (str): Token as sent to the user
+
+        Returns:
+            str: SHA-256 hex digest of the token
+        """
+        return hashlib.sha256(raw_token.encode()).hexdigest()
+
+    @classmethod
+    def create_for_user(cls, user):
+        """
+        Issue a new reset token for a user.
+
+        Only the token's hash is stored; the raw token is returned so it
+        can be sent to the user.
+
+        Args:
+            user (User): User requesting the password reset
+
+        Returns:
+            tuple: The saved PasswordResetToken and the raw token string
+        """
+        raw_token = secrets.token_urlsafe(32)
+        reset_token = cls.objects.create(
+            user=user, token_hash=cls.hash_token(raw_token)
+        )
+        return reset_token, raw_token
+
+    @classmethod
+    def get_by_token(cls, raw_token):
+        """
+        Look up a reset token by the raw token from a reset link.
+
+        Args:
+            raw_token (str): Token as received from the user
+
+        Returns:
+            PasswordResetToken: Matching token
+
+        Raises:
+            PasswordResetToken.DoesNotExist: If no token matches
+        """
+        return cls.objects.select_related('user').get(
+            token_hash=cls.hash_token(raw_token)
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        Save token, stamping its expiry time when first created.
+        """
+        if self.expires_at is None:
+            self.expires_at = timezone.now() + PASSWORD_RESET_TOKEN_LIFETIME
+        super().save(*args, **kwargs)
+
     def is_valid(self):
         """
         Check if token is valid (not used and not expired).
@@ -424,14 +777,7 @@ class PasswordResetToken(models.Model):
         Returns:
             bool: True if token is valid and not expired, False otherwise
         """
-        from datetime import timedelta
-
-        if self.is_used:
-            return False
-
-        # Token expires after 24 hours
-        expiry_time = self.created_at + timedelta(hours=24)
-        return timezone.now() < expiry_time
+        return not self.is_used and timezone.now() < self.expires_at
 
     def is_expired(self):
         """
@@ -441,3 +787,16 @@ class PasswordResetToken(models.Model):
             bool: True if token is expired, False otherwise
         """
         return not self.is_valid()
+
+    @classmethod
+    def delete_stale(cls):
+        """
+        Delete tokens that have been used or have expired.
+
+        Returns:
+            int: Number of tokens deleted
+        """
+        deleted, _ = cls.objects.filter(
+            Q(is_used=True) | Q(expires_at__lte=timezone.now())
+        ).delete()
+        return deleted
@@ -2,13 +2,196 @@
 Serializers for news application REST API.
 """
 
+from copy import copy
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
 from rest_framework import serializers
 from .models import (
     User, Article, Publisher, Category, Newsletter, Subscription
 )
 
 
-class UserSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Serializer mixin that builds the declared and model fields only once.
+
+    ``ModelSerializer.get_fields`` introspects the model on every
+    instantiation. The result is cached per serializer class and each
+    instance receives shallow copies, which are then bound to it.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        """
+        Return copies of the cached fields for this serializer class.
+
+        :return: Mapping of field names to unbound field instances
+        :rtype: dict
+        """
+        cls = self.__class__
+        cached = self._fields_cache.get(cls)
+        if cached is None:
+            cached = super().get_fields()
+            self._fields_cache[cls] = cached
+        return {name: copy(field) for name, field in cached.items()}
+
+    @classmethod
+    def warm_fields_cache(cls):
+        """
+        Build the cached fields of every serializer using this mixin.
+
+        Called once at startup so the first request to each endpoint does
+        not pay for model introspection.
+        """
+        for serializer_class in cls.__subclasses__():
+            serializer_class().get_fields()
+
+
+class PrefetchQuerysetMixin:
+    """
+    Serializer mixin that joins the relations a serializer renders.
+
+    Subclasses list the foreign keys they read in ``related_fields`` and
+    views pass their querysets through ``prefetch_queryset`` so nested
+    representations do not issue one query per row. Relations rendered
+    with ``UserSerializer`` are listed in ``user_fields`` so the user
+    columns it does not output are left unselected.
+
+    :param related_fields: Relations joined with ``select_related``
+    :type related_fields: tuple
+    :param user_fields: Joined relations rendered with UserSerializer
+    :type user_fields: tuple
+    """
+    related_fields = ()
+    user_fields = ()
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """
+        Join the relations used by this serializer.
+
+        Any relations joined by the model's default manager are dropped
+        first, so only ``related_fields`` are fetched.
+
+        :param queryset: Queryset to optimize
+        :type queryset: QuerySet
+        :return: Queryset joined to ``related_fields``
+        :rtype: QuerySet
+        """
+        queryset = queryset.select_related(None).select_related(
+            *cls.related_fields
+        )
+        if cls.user_fields:
+            queryset = queryset.defer(*(
+                f'{relation}__{name}'
+                for relation in cls.user_fields
+                for name in UserSerializer.unused_columns()
+            ))
+        return queryset
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field that reads objects loaded in bulk by its list parent.
+
+    When the serializer is the child of a list serializer with a
+    ``preloaded`` mapping, submitted keys are looked up there instead of
+    with one query per item. Keys it does not hold fall back to the normal
+    lookup, which also produces the usual validation errors.
+    """
+
+    def to_internal_value(self, data):
+        """
+        Return the object for a submitted primary key.
+
+        :param data: Submitted primary key
+        :type data: int or str
+        :return: Related model instance
+        :rtype: Model
+        """
+        preloaded = getattr(self.parent.parent, 'preloaded', {})
+        obj = preloaded.get(self.field_name, {}).get(str(data))
+        if obj is None:
+            return super().to_internal_value(data)
+        return obj
+
+
+class ArticleBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer that creates many articles with one INSERT per batch.
+
+    Related publishers and categories are loaded with one ``in_bulk``
+    query per field for the whole request. ``bulk_create`` skips
+    ``Article.save()`` and its signals, so the denormalized author and
+    publisher names are filled in here. New articles are never approved,
+    so no notifications are missed.
+    """
+    batch_size = 500
+
+    def to_internal_value(self, data):
+        """
+        Validate the submitted articles, loading related objects in bulk.
+
+        ``author_id`` is not accepted, as the view saves every article
+        with the requesting journalist as its author.
+
+        :param data: List of submitted article payloads
+        :type data: list
+        :return: List of validated article dictionaries
+        :rtype: list
+        """
+        self.child.fields.pop('author_id', None)
+        if isinstance(data, list):
+            self.preloaded = self.preload_related(data)
+        return super().to_internal_value(data)
+
+    def preload_related(self, data):
+        """
+        Load the objects referenced by the child's bulk related fields.
+
+        :param data: List of submitted article payloads
+        :type data: list
+        :return: Objects keyed by field name, then by primary key string
+        :rtype: dict
+        """
+        preloaded = {}
+        for name, field in self.child.fields.items():
+            if not isinstance(field, BulkPrimaryKeyRelatedField):
+                continue
+            queryset = field.get_queryset()
+            pk_field = queryset.model._meta.pk
+            pks = set()
+            for item in data:
+                try:
+                    pks.add(pk_field.to_python(item.get(name)))
+                except (AttributeError, DjangoValidationError):
+                    continue
+            pks.discard(None)
+            if pks:
+                preloaded[name] = {
+                    str(pk): obj for pk, obj in queryset.in_bulk(pks).items()
+                }
+        return preloaded
+
+    def create(self, validated_data):
+        """
+        Create all validated articles with ``bulk_create``.
+
+        :param validated_data: List of validated article dictionaries
+        :type validated_data: list
+        :return: Created Article instances
+        :rtype: list
+        """
+        articles = [Article(**attrs) for attrs in validated_data]
+        for article in articles:
+            article.sync_denormalized_names()
+        return Article.objects.bulk_create(
+            articles, batch_size=self.batch_size
+        )
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for User model with role-based field access.
     
@@ -44,8 +227,21 @@ class UserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'date_joined']
 
+    @classmethod
+    def unused_columns(cls):
+        """
+        Return the User columns this serializer never outputs.
+
+        :return: Names of concrete User fields missing from Meta.fields
+        :rtype: list
+        """
+        return [
+            field.name for field in User._meta.concrete_fields
+            if field.name not in cls.Meta.fields
+        ]
+
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Category model.
     """
@@ -57,7 +253,7 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description']
 
 
-class PublisherSerializer(serializers.ModelSerializer):
+class PublisherSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Publisher model.
     """
@@ -72,7 +268,15 @@ class PublisherSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+# Read-only nested serializers shared by every serializer that embeds a
+# user, publisher or category
+_USER_READ_ONLY = UserSerializer(read_only=True)
+_PUBLISHER_READ_ONLY = PublisherSerializer(read_only=True)
+_CATEGORY_READ_ONLY = CategorySerializer(read_only=True)
+
+
+class ArticleSerializer(CachedFieldsMixin, PrefetchQuerysetMixin,
+                        serializers.ModelSerializer):
     """
     Serializer for Article model with nested relationships.
     
@@ -86,19 +290,33 @@ class ArticleSerializer(serializers.ModelSerializer):
     :type publisher: PublisherSerializer
     :param category: Nested CategorySerializer for category information
     :type category: CategorySerializer
-    :param author_id: Write-only field for author ID assignment
-    :type author_id: int
-    :param publisher_id: Write-only field for publisher ID assignment
-    :type publisher_id: int
-    :param category_id: Write-only field for category ID assignment
-    :type category_id: int
+    :param author_id: Write-only primary key of the article author
+    :type author_id: PrimaryKeyRelatedField
+    :param publisher_id: Write-only primary key of the publisher
+    :type publisher_id: BulkPrimaryKeyRelatedField
+    :param category_id: Write-only primary key of the category
+    :type category_id: BulkPrimaryKeyRelatedField
     """
-    author = UserSerializer(read_only=True)
-    publisher = PublisherSerializer(read_only=True)
-    category = CategorySerializer(read_only=True)
-    author_id = serializers.IntegerField(write_only=True)
-    publisher_id = serializers.IntegerField(write_only=True, required=False)
-    category_id = serializers.IntegerField(write_only=True, required=False)
+    author = _USER_READ_ONLY
+    publisher = _PUBLISHER_READ_ONLY
+    category = _CATEGORY_READ_ONLY
+    author_id = serializers.PrimaryKeyRelatedField(
+        source='author', write_only=True,
+        queryset=User.objects.filter(role=User.ROLE_JOURNALIST)
+    )
+    publisher_id = BulkPrimaryKeyRelatedField(
+        source='publisher', write_only=True, required=False,
+        queryset=Publisher.objects.all()
+    )
+    category_id = BulkPrimaryKeyRelatedField(
+        source='category', write_only=True, required=False,
+        queryset=Category.objects.all()
+    )
+
+    related_fields = ('author', 'publisher', 'category')
+    user_fields = ('author',)
+    # Changing these must go through Article.save() to sync cached names
+    save_only_fields = frozenset({'author', 'publisher'})
 
     class Meta:
         """
@@ -113,63 +331,49 @@ class ArticleSerializer(serializers.ModelSerializer):
         read_only_fields = [
             'id', 'is_approved', 'created_at', 'updated_at', 'published_at'
         ]
+        list_serializer_class = ArticleBulkListSerializer
 
-    def create(self, validated_data):
-        """
-        Create article with proper author assignment.
-        
-        This method creates a new article instance with the provided
-        validated data, handling author, publisher, and category
-        relationships properly.
-        
-        :param validated_data: Dictionary of validated form data
-        :type validated_data: dict
-        :return: Created Article instance
-        :rtype: Article
+    def update(self, instance, validated_data):
         """
-        author_id = validated_data.pop('author_id')
-        publisher_id = validated_data.pop('publisher_id', None)
-        category_id = validated_data.pop('category_id', None)
+        Update an article, writing plain column changes with one UPDATE.
 
-        article = Article.objects.create(
-            author_id=author_id,
-            publisher_id=publisher_id,
-            category_id=category_id,
-            **validated_data
-        )
-        return article
+        When neither the author nor the publisher changes and the article
+        is not approved, only the submitted columns are written with
+        ``QuerySet.update``. ``post_save`` only acts on approved articles,
+        so skipping ``save()`` loses nothing. Other updates use the
+        default ``ModelSerializer.update``.
 
-    def update(self, instance, validated_data):
-        """
-        Update article with proper field handling.
+        :param instance: Article being updated
+        :type instance: Article
+        :param validated_data: Dictionary of validated field values
+        :type validated_data: dict
+        :return: Updated Article instance
+        :rtype: Article
         """
-        author_id = validated_data.pop('author_id', None)
-        publisher_id = validated_data.pop('publisher_id', None)
-        category_id = validated_data.pop('category_id', None)
-
-        if author_id:
-            instance.author_id = author_id
-        if publisher_id:
-            instance.publisher_id = publisher_id
-        if category_id:
-            instance.category_id = category_id
+        if (instance.is_approved or
+                not self.save_only_fields.isdisjoint(validated_data)):
+            return super().update(instance, validated_data)
 
+        validated_data['updated_at'] = timezone.now()
+        Article.objects.filter(pk=instance.pk).update(**validated_data)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-
-        instance.save()
         return instance
 
 
-class NewsletterSerializer(serializers.ModelSerializer):
+class NewsletterSerializer(CachedFieldsMixin, PrefetchQuerysetMixin,
+                           serializers.ModelSerializer):
     """
     Serializer for Newsletter model.
     """
-    author = UserSerializer(read_only=True)
-    publisher = PublisherSerializer(read_only=True)
+    author = _USER_READ_ONLY
+    publisher = _PUBLISHER_READ_ONLY
     author_id = serializers.IntegerField(write_only=True)
     publisher_id = serializers.IntegerField(write_only=True, required=False)
 
+    related_fields = ('author', 'publisher')
+    user_fields = ('author',)
+
     class Meta:
         """
         Meta options for NewsletterSerializer.
@@ -185,28 +389,28 @@ class NewsletterSerializer(serializers.ModelSerializer):
         """
         Create newsletter with proper author assignment.
         """
-        author_id = validated_data.pop('author_id')
-        publisher_id = validated_data.pop('publisher_id', None)
-
-        newsletter = Newsletter.objects.create(
-            author_id=author_id,
-            publisher_id=publisher_id,
-            **validated_data
-        )
-        return newsletter
+        return Newsletter.objects.create(**{
+            'author_id': validated_data.pop('author_id'),
+            'publisher_id': validated_data.pop('publisher_id', None),
+            **validated_data,
+        })
 
 
-class SubscriptionSerializer(serializers.ModelSerializer):
+class SubscriptionSerializer(CachedFieldsMixin, PrefetchQuerysetMixin,
+                             serializers.ModelSerializer):
     """
     Serializer for Subscription model.
     """
-    user = UserSerializer(read_only=True)
-    publisher = PublisherSerializer(read_only=True)
-    journalist = UserSerializer(read_only=True)
+    user = _USER_READ_ONLY
+    publisher = _PUBLISHER_READ_ONLY
+    journalist = _USER_READ_ONLY
     user_id = serializers.IntegerField(write_only=True)
     publisher_id = serializers.IntegerField(write_only=True, required=False)
     journalist_id = serializers.IntegerField(write_only=True, required=False)
 
+    related_fields = ('user', 'publisher', 'journalist')
+    user_fields = ('user', 'journalist')
+
     class Meta:
         """
         Meta class for Subscription model.
@@ -220,52 +424,39 @@ class SubscriptionSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """
-        Validate that either publisher or journalist is selected.
+        Validate that exactly one of publisher or journalist is selected.
         """
-        publisher_id = data.get('publisher_id')
-        journalist_id = data.get('journalist_id')
-
-        if not publisher_id and not journalist_id:
-            raise serializers.ValidationError(
-                'Either publisher or journalist must be selected'
-            )
-
-        if publisher_id and journalist_id:
+        # Both set or both missing
+        if bool(data.get('publisher_id')) == bool(data.get('journalist_id')):
             raise serializers.ValidationError(
-                'Cannot subscribe to both publisher and journalist'
+                'Exactly one of publisher or journalist must be selected'
             )
-
         return data
 
     def create(self, validated_data):
         """
         Create subscription with proper field assignment.
         """
-        user_id = validated_data.pop('user_id')
-        publisher_id = validated_data.pop('publisher_id', None)
-        journalist_id = validated_data.pop('journalist_id', None)
-
-        subscription = Subscription.objects.create(
-            user_id=user_id,
-            publisher_id=publisher_id,
-            journalist_id=journalist_id,
-            **validated_data
-        )
-        return subscription
+        return Subscription.objects.create(**{
+            'user_id': validated_data.pop('user_id'),
+            'publisher_id': validated_data.pop('publisher_id', None),
+            'journalist_id': validated_data.pop('journalist_id', None),
+            **validated_data,
+        })
 
 
-class ArticleListSerializer(serializers.ModelSerializer):
+class ArticleListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Simplified serializer for article lists.
     """
-    author_name = serializers.CharField(
-        source='author.username', read_only=True
-    )
-    publisher_name = serializers.CharField(
-        source='publisher.name', read_only=True
+    author_name = serializers.ReadOnlyField(source='author.username')
+    # Articles without a publisher or category render None, as in
+    # values_data()
+    publisher_name = serializers.ReadOnlyField(
+        source='publisher.name', allow_null=True
     )
-    category_name = serializers.CharField(
-        source='category.name', read_only=True
+    category_name = serializers.ReadOnlyField(
+        source='category.name', allow_null=True
     )
 
     class Meta:
@@ -277,3 +468,39 @@ class ArticleListSerializer(serializers.ModelSerializer):
             'id', 'title', 'summary', 'author_name', 'publisher_name',
             'category_name', 'status', 'created_at', 'published_at'
         ]
+
+    @classmethod
+    def values_data(cls, queryset):
+        """
+        Serialize articles straight from ``values_list()`` rows.
+
+        Produces the same fields as ``data`` without building model
+        instances or running serializer fields per row. Articles without
+        a publisher or category get ``None`` for its name.
+
+        :param queryset: Article queryset to serialize
+        :type queryset: QuerySet
+        :return: List of article dictionaries
+        :rtype: list
+        """
+        to_datetime = serializers.DateTimeField().to_representation
+        rows = queryset.values_list(
+            'id', 'title', 'summary', 'status', 'created_at',
+            'published_at', 'author__username', 'publisher__name',
+            'category__name'
+        )
+        return [
+            {
+                'id': pk,
+                'title': title,
+                'summary': summary,
+                'author_name': author_name,
+                'publisher_name': publisher_name,
+                'category_name': category_name,
+                'status': status,
+                'created_at': to_datetime(created_at),
+                'published_at': to_datetime(published_at),
+            }
+            for (pk, title, summary, status, created_at, published_at,
+                 author_name, publisher_name, category_name) in rows
+        ]
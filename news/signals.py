@@ -3,13 +3,27 @@ Django signals for handling article approval notifications and social media
 posting.
 """
 
+import logging
+from itertools import islice
+
 import requests
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.conf import settings
 from django.template.loader import render_to_string
-from .models import Article, Subscription
+from .cache_keys import (
+    PUBLISHER_CHOICES_KEY, CATEGORY_CHOICES_KEY, bump_article_list_version,
+    bump_journalist_choices_version
+)
+from .models import (
+    FANOUT_CHUNK_SIZE, Article, Category, Publisher, Subscription, User,
+    articles_approved
+)
+from .serializers import UserSerializer
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=Article)
@@ -22,6 +36,23 @@ def handle_article_approval(sender, instance, created, **kwargs):
         post_to_twitter(instance)
 
 
+@receiver(articles_approved, sender=Article)
+def handle_bulk_article_approval(sender, articles, **kwargs):
+    """
+    Notify subscribers of bulk-approved articles, then publish them.
+
+    ``Article.bulk_approve`` skips ``save()``, so this does the work of
+    ``handle_article_approval`` and ``update_article_status`` for the
+    whole batch.
+    """
+    for article in articles:
+        send_approval_notifications(article)
+        post_to_twitter(article)
+    Article.objects.filter(
+        pk__in=[article.pk for article in articles]
+    ).update(status='published')
+
+
 def send_approval_notifications(article):
     """
     Send email notifications to subscribers when article is approved.
@@ -32,55 +63,54 @@ def send_approval_notifications(article):
     email addresses, and sends both HTML and plain text versions of the
     notification.
 
+    Addresses are streamed from the database and sent as one BCC message
+    per FANOUT_CHUNK_SIZE subscribers, so memory stays bounded for
+    popular publishers and subscribers never see each other's addresses.
+
     :param article: Article instance that was approved and needs
         notification sent to subscribers
     :type article: Article
     :raises Exception: If email sending fails, error is logged but not
         raised
     """
-    # Get all subscribers for the article's publisher and journalist
-    publisher_subscribers = []
-    journalist_subscribers = []
-
-    if article.publisher:
-        publisher_subscribers = Subscription.objects.filter(
-            publisher=article.publisher
-        ).values_list('user__email', flat=True)
-
-    if article.author:
-        journalist_subscribers = Subscription.objects.filter(
-            journalist=article.author
-        ).values_list('user__email', flat=True)
-
-    # Combine and deduplicate subscriber emails
-    all_subscribers = set(publisher_subscribers) | set(journalist_subscribers)
+    # Deduplicated subscribers of the publisher and journalist at once
+    emails = Subscription.subscriber_emails(
+        publisher_id=article.publisher_id,
+        journalist_id=article.author_id
+    ).iterator(chunk_size=FANOUT_CHUNK_SIZE)
+    batch = list(islice(emails, FANOUT_CHUNK_SIZE))
+    if not batch:
+        return
 
-    if all_subscribers:
-        subject = f'New Article: {article.title}'
+    subject = f'New Article: {article.title}'
 
-        # Create email content
-        context = {
-            'article': article,
-            'site_url': (settings.SITE_URL if hasattr(settings, 'SITE_URL')
-                         else 'http://localhost:8000')
-        }
+    # Create email content
+    context = {
+        'article': article,
+        'site_url': (settings.SITE_URL if hasattr(settings, 'SITE_URL')
+                     else 'http://localhost:8000')
+    }
 
-        html_message = render_to_string(
-            'news/email/article_notification.html', context)
-        plain_message = render_to_string(
-            'news/email/article_notification.txt', context)
+    html_message = render_to_string(
+        'news/email/article_notification.html', context)
+    plain_message = render_to_string(
+        'news/email/article_notification.txt', context)
 
+    connection = get_connection()
+    while batch:
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=plain_message,
+            from_email=settings.EMAIL_HOST_USER,
+            bcc=batch,
+            connection=connection,
+        )
+        message.attach_alternative(html_message, 'text/html')
         try:
-            send_mail(
-                subject=subject,
-                message=plain_message,
-                from_email=settings.EMAIL_HOST_USER,
-                recipient_list=list(all_subscribers),
-                html_message=html_message,
-                fail_silently=False,
-            )
+            message.send()
         except Exception as e:
-            print(f"Error sending email notifications: {e}")
+            logger.error("Error sending email notifications: %s", e)
+        batch = list(islice(emails, FANOUT_CHUNK_SIZE))
 
 
 def post_to_twitter(article):
@@ -101,7 +131,7 @@ def post_to_twitter(article):
     """
     # Check if Twitter is enabled
     if not getattr(settings, 'TWITTER_ENABLED', False):
-        print("Twitter posting disabled")
+        logger.debug("Twitter posting disabled")
         return
 
     # Twitter API v2 endpoint for posting tweets
@@ -138,15 +168,17 @@ def post_to_twitter(article):
         )
 
         if response.status_code == 201:
-            print(f"Successfully posted article '{article.title}' to Twitter")
+            logger.info(
+                "Successfully posted article '%s' to Twitter", article.title
+            )
         else:
-            print(
-                f"Failed to post to Twitter: {response.status_code} - "
-                f"{response.text}"
+            logger.warning(
+                "Failed to post to Twitter: %s - %s",
+                response.status_code, response.text
             )
 
     except requests.exceptions.RequestException as e:
-        print(f"Error posting to Twitter: {e}")
+        logger.error("Error posting to Twitter: %s", e)
 
 
 @receiver(post_save, sender=Article)
@@ -157,3 +189,107 @@ def update_article_status(sender, instance, created, **kwargs):
     if instance.is_approved and instance.status != 'published':
         instance.status = 'published'
         instance.save(update_fields=['status'])
+
+
+@receiver([post_save, post_delete], sender=Publisher)
+def invalidate_publisher_choices(sender, **kwargs):
+    """
+    Drop cached publisher dropdown options when a publisher changes.
+    """
+    cache.delete(PUBLISHER_CHOICES_KEY)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_choices(sender, **kwargs):
+    """
+    Drop cached category dropdown options when a category changes.
+    """
+    cache.delete(CATEGORY_CHOICES_KEY)
+
+
+@receiver(post_save, sender=User)
+def invalidate_journalist_choices(sender, instance, created, update_fields,
+                                  **kwargs):
+    """
+    Invalidate cached journalist options when a journalist may have changed.
+
+    New non-journalists and partial saves that touch neither the role nor
+    the username (such as the last_login update on every login) leave the
+    option list untouched.
+    """
+    if created and not instance.is_journalist():
+        return
+    if (update_fields is not None and
+            {'role', 'username'}.isdisjoint(update_fields)):
+        return
+    bump_journalist_choices_version()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_journalist_choices(sender, instance, **kwargs):
+    """
+    Invalidate cached journalist options when a journalist is deleted.
+    """
+    if instance.is_journalist():
+        bump_journalist_choices_version()
+
+
+@receiver(post_save, sender=User)
+def sync_article_author_username(sender, instance, created, update_fields,
+                                 **kwargs):
+    """
+    Propagate a username change to the articles denormalizing it.
+    """
+    if created or (update_fields is not None and
+                   'username' not in update_fields):
+        return
+    Article.objects.filter(author=instance).exclude(
+        author_username=instance.username
+    ).update(author_username=instance.username)
+
+
+@receiver(post_save, sender=Publisher)
+def sync_article_publisher_name(sender, instance, created, update_fields,
+                                **kwargs):
+    """
+    Propagate a publisher rename to the articles denormalizing it.
+    """
+    if created or (update_fields is not None and
+                   'name' not in update_fields):
+        return
+    Article.objects.filter(publisher=instance).exclude(
+        publisher_name=instance.name
+    ).update(publisher_name=instance.name)
+
+
+@receiver([post_save, post_delete], sender=Publisher)
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_article_lists(sender, **kwargs):
+    """
+    Invalidate article list ETags when a nested publisher or category changes.
+    """
+    bump_article_list_version()
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_article_lists(sender, instance, created, update_fields,
+                                    **kwargs):
+    """
+    Invalidate article list ETags when a rendered user field may have changed.
+
+    New users have no articles yet, and partial saves that skip every field
+    ``UserSerializer`` renders (such as the last_login update on every
+    login) leave the lists untouched.
+    """
+    if created or (update_fields is not None and
+                   set(UserSerializer.Meta.fields).isdisjoint(update_fields)):
+        return
+    bump_article_list_version()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_author_article_lists(sender, **kwargs):
+    """
+    Invalidate article list ETags when a user is deleted.
+    """
+    bump_article_list_version()
@@ -2,12 +2,28 @@
 Unit tests for news application models, views, and API.
 """
 
+import json
+from unittest import mock
+
 from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.cache import cache
+from django.core.mail import send_mail
+from django.db import IntegrityError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 from rest_framework import status
 from rest_framework.authtoken.models import Token
+from . import email_backends
+from .forms import ArticleForm, ResetPasswordForm, SubscriptionForm
+from .renderers import ORJSONRenderer
+from .signals import send_approval_notifications
+from .serializers import (
+    ArticleListSerializer, ArticleSerializer, CachedFieldsMixin,
+    UserSerializer
+)
 from .models import (
     Publisher, Category, Article, Subscription
 )
@@ -46,6 +62,10 @@ class UserModelTest(TestCase):
         self.assertEqual(self.user.role, 'reader')
         self.assertTrue(self.user.is_reader())
 
+    def test_user_str(self):
+        """Test that str(user) shows the role label."""
+        self.assertEqual(str(self.user), 'testuser (Reader)')
+
     def test_user_roles(self):
         """
         Test user role method functionality.
@@ -75,6 +95,33 @@ class UserModelTest(TestCase):
         )
         self.assertTrue(journalist.is_journalist())
 
+    def test_has_published_articles(self):
+        """Test published article presence check for journalists."""
+        journalist = User.objects.create_user(
+            username='journalist',
+            email='journalist@example.com',
+            password='testpass123',
+            role='journalist'
+        )
+        self.assertFalse(journalist.has_published_articles())
+        Article.objects.create(
+            title='Published',
+            content='Content.',
+            author=journalist,
+            status='published'
+        )
+        with self.assertNumQueries(1):
+            self.assertTrue(journalist.has_published_articles())
+
+    def test_recent_articles(self):
+        """Test that recent articles are limited and newest first."""
+        for title in ('First', 'Second', 'Third'):
+            Article.objects.create(
+                title=title, content='Content.', author=self.user
+            )
+        titles = [a.title for a in self.user.recent_articles(limit=2)]
+        self.assertEqual(titles, ['Third', 'Second'])
+
 
 class PublisherModelTest(TestCase):
     """
@@ -143,6 +190,92 @@ class ArticleModelTest(TestCase):
         self.assertEqual(self.article.status, 'published')
         self.assertEqual(self.article.approved_by, editor)
 
+    def test_denormalized_names(self):
+        """Test that author and publisher names are copied on save."""
+        self.assertEqual(self.article.author_username, 'journalist')
+        self.assertEqual(self.article.publisher_name, 'Test Publisher')
+
+    def test_denormalized_names_follow_renames(self):
+        """Test that renaming author or publisher updates articles."""
+        self.journalist.username = 'renamed'
+        self.journalist.save()
+        self.publisher.name = 'Renamed Publisher'
+        self.publisher.save()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.author_username, 'renamed')
+        self.assertEqual(self.article.publisher_name, 'Renamed Publisher')
+
+    def test_related_articles_single_query(self):
+        """Test that reverse article lookups join their relations."""
+        Article.objects.create(
+            title='Second Article',
+            content='More content.',
+            author=self.journalist,
+            publisher=self.publisher,
+            category=self.category
+        )
+        with self.assertNumQueries(1):
+            rows = [
+                (a.author.username, a.publisher.name, a.category.name)
+                for a in self.publisher.articles.all()
+            ]
+        self.assertEqual(len(rows), 2)
+
+    def test_bulk_approve(self):
+        """Test approving several articles notifies and publishes them."""
+        editor = User.objects.create_user(
+            username='editor',
+            email='editor@example.com',
+            password='testpass123',
+            role='editor'
+        )
+        reader = User.objects.create_user(
+            username='reader',
+            email='reader@example.com',
+            password='testpass123',
+            role='reader'
+        )
+        Subscription.objects.create(user=reader, publisher=self.publisher)
+        second = Article.objects.create(
+            title='Second Article',
+            content='More content.',
+            author=self.journalist
+        )
+        mail.outbox = []
+
+        updated = Article.bulk_approve(
+            Article.objects.filter(pk__in=[self.article.pk, second.pk]),
+            editor
+        )
+        self.assertEqual(updated, 2)
+        second.refresh_from_db()
+        self.assertTrue(second.is_approved)
+        self.assertEqual(second.status, 'published')
+        self.assertEqual(second.approved_by, editor)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, 'New Article: Test Article')
+
+    def test_bulk_approve_by_pk_skips_approved(self):
+        """Test approving by primary key leaves approved rows alone."""
+        editor = User.objects.create_user(
+            username='editor',
+            email='editor@example.com',
+            password='testpass123',
+            role='editor'
+        )
+        self.article.approve(editor)
+        approved_at = Article.objects.get(pk=self.article.pk).approved_at
+        second = Article.objects.create(
+            title='Second Article',
+            content='More content.',
+            author=self.journalist
+        )
+
+        updated = Article.bulk_approve([self.article.pk, second.pk], editor)
+        self.assertEqual(updated, 1)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.approved_at, approved_at)
+
 
 class SubscriptionModelTest(TestCase):
     """
@@ -187,6 +320,79 @@ class SubscriptionModelTest(TestCase):
         self.assertEqual(subscription.journalist, self.journalist)
         self.assertIsNone(subscription.publisher)
 
+    def test_subscription_list_single_query(self):
+        """Test that listing subscriptions joins their targets."""
+        Subscription.objects.create(user=self.reader, publisher=self.publisher)
+        Subscription.objects.create(
+            user=self.reader,
+            journalist=self.journalist
+        )
+        with self.assertNumQueries(1):
+            labels = [str(sub) for sub in self.reader.subscriptions.all()]
+        self.assertEqual(len(labels), 2)
+
+    def test_bulk_subscribe(self):
+        """Test subscribing to several targets in one statement."""
+        second = Publisher.objects.create(name='Second Publisher')
+        Subscription.objects.create(user=self.reader, publisher=self.publisher)
+        with self.assertNumQueries(1):
+            Subscription.bulk_subscribe(
+                self.reader, [self.publisher.pk, second.pk], 'publisher'
+            )
+        self.assertEqual(
+            Subscription.objects.filter(user=self.reader).count(), 2
+        )
+
+    def test_bulk_subscribe_rejects_unknown_target(self):
+        """Test that bulk_subscribe validates the target type."""
+        with self.assertRaises(ValueError):
+            Subscription.bulk_subscribe(self.reader, [1], 'category')
+
+    def test_subscription_requires_one_target(self):
+        """Test that the database rejects subscriptions without a target."""
+        with self.assertRaises(IntegrityError):
+            Subscription.objects.create(user=self.reader)
+
+    def test_subscription_form_requires_one_target(self):
+        """Test that the form enforces exactly one subscription target."""
+        self.assertFalse(SubscriptionForm(data={}).is_valid())
+        both = SubscriptionForm(data={
+            'publisher': self.publisher.pk,
+            'journalist': self.journalist.pk,
+        })
+        self.assertFalse(both.is_valid())
+        self.assertIn(
+            'You must subscribe to either a publisher or a journalist.',
+            both.non_field_errors()
+        )
+
+    def test_subscription_target(self):
+        """Test that target returns the subscribed publisher or journalist."""
+        by_publisher = Subscription.objects.create(
+            user=self.reader,
+            publisher=self.publisher
+        )
+        by_journalist = Subscription.objects.create(
+            user=self.reader,
+            journalist=self.journalist
+        )
+        self.assertEqual(by_publisher.target, self.publisher)
+        self.assertEqual(by_journalist.target, self.journalist)
+
+    def test_subscriber_emails_single_query(self):
+        """Test that both subscription sides are fetched in one query."""
+        Subscription.objects.create(user=self.reader, publisher=self.publisher)
+        Subscription.objects.create(
+            user=self.reader,
+            journalist=self.journalist
+        )
+        with self.assertNumQueries(1):
+            emails = list(Subscription.subscriber_emails(
+                publisher_id=self.publisher.pk,
+                journalist_id=self.journalist.pk
+            ))
+        self.assertEqual(emails, [self.reader.email])
+
 
 class ArticleViewTest(TestCase):
     """
@@ -226,6 +432,15 @@ class ArticleViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Article')
 
+    def test_search_by_publisher(self):
+        """Test filtering search results by publisher name."""
+        response = self.client.get(
+            '/search/', {'publisher': 'Test Publisher'}
+        )
+        self.assertContains(response, 'Test Article')
+        response = self.client.get('/search/', {'publisher': 'Other'})
+        self.assertNotContains(response, 'Test Article')
+
     def test_article_detail_view(self):
         """Test article detail view."""
         self.client.force_login(self.reader)
@@ -257,6 +472,7 @@ class APITest(APITestCase):
     """
     def setUp(self):
         """Set up test data."""
+        cache.clear()
         self.reader = User.objects.create_user(
             username='reader',
             email='reader@example.com',
@@ -306,6 +522,185 @@ class APITest(APITestCase):
         response = self.client.get('/api/articles/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_article_list_api_query_count(self):
+        """Test that nested article relations do not query per row."""
+        for i in range(3):
+            Article.objects.create(
+                title=f'Article {i}',
+                content='Content.',
+                author=self.journalist,
+                publisher=self.publisher
+            )
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        # Token authentication, the ETag aggregate and the article query
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/articles/')
+        self.assertEqual(len(json.loads(response.content)), 4)
+
+    def test_nested_user_columns_deferred(self):
+        """Test that nested users skip columns the API never outputs."""
+        articles = ArticleSerializer.prefetch_queryset(Article.objects.all())
+        sql = str(articles.query)
+        self.assertNotIn('password', sql)
+        self.assertIn('email', sql)
+        with self.assertNumQueries(1):
+            data = ArticleSerializer(articles, many=True).data
+        self.assertEqual(data[0]['author']['username'], 'journalist')
+
+    def test_article_list_values_data_matches_serializer(self):
+        """Test that the values_list() fast path matches serializer output."""
+        self.article.category = Category.objects.create(name='Technology')
+        self.article.save()
+        Article.objects.create(
+            title='Unfiled Article',
+            content='No publisher or category.',
+            author=self.journalist
+        )
+        articles = Article.objects.all()
+        with self.assertNumQueries(1):
+            rows = ArticleListSerializer.values_data(articles)
+        self.assertEqual(
+            rows, ArticleListSerializer(articles, many=True).data
+        )
+        unfiled = next(r for r in rows if r['title'] == 'Unfiled Article')
+        self.assertIsNone(unfiled['publisher_name'])
+        self.assertIsNone(unfiled['category_name'])
+
+    def test_create_subscription_api(self):
+        """Test subscribing to a journalist via API."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.reader_token.key)
+        response = self.client.post('/api/subscriptions/', {
+            'user_id': self.reader.id,
+            'journalist_id': self.journalist.id
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Subscription.objects.filter(
+            user=self.reader, journalist=self.journalist
+        ).exists())
+
+    def test_subscription_api_requires_exactly_one_target(self):
+        """Test that subscriptions need exactly one target via API."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.reader_token.key)
+        targets = (
+            {},
+            {'publisher_id': self.publisher.id,
+             'journalist_id': self.journalist.id},
+        )
+        for target in targets:
+            response = self.client.post(
+                '/api/subscriptions/', {'user_id': self.reader.id, **target}
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+            self.assertIn('non_field_errors', response.data)
+
+    def test_serializer_fields_cached_at_startup(self):
+        """Test that serializer fields are built when the app loads."""
+        self.assertIn(ArticleSerializer, CachedFieldsMixin._fields_cache)
+        self.assertIn(UserSerializer, CachedFieldsMixin._fields_cache)
+
+    def test_serializer_fields_are_per_instance(self):
+        """Test that cached serializer fields are bound per instance."""
+        first = ArticleListSerializer(self.article)
+        second = ArticleListSerializer(self.article)
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(second.fields['title'].parent, second)
+        self.assertEqual(second.data['author_name'], 'journalist')
+
+    def test_article_list_api_conditional_get(self):
+        """Test that an unchanged article list answers 304."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        response = self.client.get('/api/articles/')
+        etag = response['ETag']
+        self.assertIn('Authorization', response['Vary'])
+
+        response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.post('/api/articles/', {
+            'title': 'Another Article',
+            'content': 'More content.',
+            'author_id': self.journalist.id
+        })
+        response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_article_list_etag_follows_related_changes(self):
+        """Test that editing a nested publisher or author changes the ETag."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        etag = self.client.get('/api/articles/')['ETag']
+
+        self.publisher.description = 'An updated publisher'
+        self.publisher.save()
+        response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(response.content)[0]['publisher']['description'],
+            'An updated publisher'
+        )
+
+        etag = response['ETag']
+        self.journalist.email = 'new@example.com'
+        self.journalist.save(update_fields=['email'])
+        response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(response.content)[0]['author']['email'],
+            'new@example.com'
+        )
+
+        etag = response['ETag']
+        self.journalist.save(update_fields=['last_login'])
+        response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_json_renderer_matches_drf_output(self):
+        """Test that the orjson renderer produces DRF's exact JSON."""
+        data = {
+            'title': 'Caf\u00e9 \u2028',
+            'created_at': timezone.now(),
+            'published_on': timezone.now().date(),
+            'author': {'id': 1},
+            'tags': {0: ['Not a valid string.']},
+        }
+        self.assertEqual(
+            ORJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+    def test_article_list_api_served_from_cache(self):
+        """Test that an unchanged article list is served pre-rendered."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        first = self.client.get('/api/articles/')
+        # Only token authentication hits the database
+        with self.assertNumQueries(1):
+            second = self.client.get('/api/articles/')
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(json.loads(second.content)[0]['title'],
+                         'Test Article')
+
+    def test_article_list_cache_keyed_by_media_type(self):
+        """Test that indented and compact lists are cached separately."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        compact = self.client.get('/api/articles/')
+        indented = self.client.get(
+            '/api/articles/', HTTP_ACCEPT='application/json; indent=4'
+        )
+        self.assertNotIn(b'\n', compact.content)
+        self.assertIn(b'\n    ', indented.content)
+        self.assertEqual(json.loads(indented.content),
+                         json.loads(compact.content))
+
     def test_create_article_api(self):
         """Test creating article via API."""
         self.client.credentials(
@@ -319,6 +714,116 @@ class APITest(APITestCase):
         response = self.client.post('/api/articles/', data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def test_create_article_api_rejects_unknown_publisher(self):
+        """Test that related IDs are validated on article create."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        data = {
+            'title': 'API Test Article',
+            'content': 'This is a test article created via API.',
+            'author_id': self.journalist.id,
+            'publisher_id': self.publisher.id + 100
+        }
+        response = self.client.post('/api/articles/', data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('publisher_id', response.data)
+
+    def test_bulk_create_articles_api(self):
+        """Test creating several articles in one request."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        data = [
+            {
+                'title': f'Bulk Article {i}',
+                'content': 'Bulk content.',
+                'publisher_id': self.publisher.id
+            }
+            for i in range(3)
+        ]
+        response = self.client.post(
+            '/api/articles/bulk/', data, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {'created': 3})
+        article = Article.objects.get(title='Bulk Article 0')
+        self.assertEqual(article.author_username, 'journalist')
+        self.assertEqual(article.publisher_name, 'Test Publisher')
+
+    def test_bulk_create_articles_api_query_count(self):
+        """Test that related IDs are resolved in bulk, not per article."""
+        category = Category.objects.create(name='Technology')
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        data = [
+            {
+                'title': f'Bulk Article {i}',
+                'content': 'Bulk content.',
+                'publisher_id': self.publisher.id,
+                'category_id': category.id
+            }
+            for i in range(20)
+        ]
+        # Token authentication, one lookup per related field and the INSERT
+        with self.assertNumQueries(4):
+            response = self.client.post(
+                '/api/articles/bulk/', data, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Article.objects.filter(category=category).count(), 20
+        )
+
+    def test_bulk_create_articles_api_rejects_unknown_publisher(self):
+        """Test that bulk-resolved IDs are still validated per article."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        data = [
+            {'title': 'Valid', 'content': 'Content.',
+             'publisher_id': self.publisher.id},
+            {'title': 'Invalid', 'content': 'Content.',
+             'publisher_id': self.publisher.id + 100},
+        ]
+        response = self.client.post(
+            '/api/articles/bulk/', data, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('publisher_id', response.data[1])
+
+    def test_bulk_create_articles_api_requires_journalist(self):
+        """Test that bulk article creation requires journalist role."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.reader_token.key)
+        response = self.client.post('/api/articles/bulk/', [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_update_article_api(self):
+        """Test updating an article's category via API."""
+        category = Category.objects.create(name='Technology')
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        response = self.client.patch(
+            f'/api/articles/{self.article.pk}/',
+            {'category_id': category.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['category']['name'], 'Technology')
+
+    def test_partial_update_article_api_writes_columns(self):
+        """Test that a title-only PATCH updates just that column."""
+        updated_at = self.article.updated_at
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Token ' + self.journalist_token.key)
+        response = self.client.patch(
+            f'/api/articles/{self.article.pk}/', {'title': 'New Title'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'New Title')
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.title, 'New Title')
+        self.assertEqual(self.article.author_username, 'journalist')
+        self.assertGreater(self.article.updated_at, updated_at)
+
     def test_approve_article_api_requires_editor(self):
         """Test that approving article requires editor role."""
         self.client.credentials(
@@ -431,7 +936,123 @@ class EmailNotificationTest(TestCase):
         # Check that email was sent
         self.assertEqual(len(mail.outbox), 1)
         self.assertEqual(mail.outbox[0].subject, 'New Article: Test Article')
-        self.assertIn(self.reader.email, mail.outbox[0].to)
+        self.assertIn(self.reader.email, mail.outbox[0].bcc)
+
+    def test_email_notification_sent_in_batches(self):
+        """Test that subscribers are split across BCC batches."""
+        second_reader = User.objects.create_user(
+            username='reader2',
+            email='reader2@example.com',
+            password='testpass123',
+            role='reader'
+        )
+        Subscription.objects.create(
+            user=second_reader,
+            journalist=self.journalist
+        )
+        mail.outbox = []
+
+        with mock.patch('news.signals.FANOUT_CHUNK_SIZE', 1):
+            send_approval_notifications(self.article)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            sorted(email for message in mail.outbox
+                   for email in message.bcc),
+            ['reader2@example.com', 'reader@example.com']
+        )
+        self.assertEqual(mail.outbox[0].to, [])
+
+
+class FormChoicesCacheTest(TestCase):
+    """
+    Test cases for cached dropdown options on forms.
+    """
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.publisher = Publisher.objects.create(name='Test Publisher')
+        self.category = Category.objects.create(name='Technology')
+        self.journalist = User.objects.create_user(
+            username='journalist',
+            email='journalist@example.com',
+            password='testpass123',
+            role='journalist'
+        )
+
+    def test_warm_cache_renders_without_queries(self):
+        """Test that dropdowns render from cache once warmed."""
+        ArticleForm().as_p()
+        SubscriptionForm().as_p()
+        with self.assertNumQueries(0):
+            ArticleForm().as_p()
+            SubscriptionForm().as_p()
+
+    def test_cache_invalidated_on_save(self):
+        """Test that new publishers appear after the cache is warmed."""
+        ArticleForm().as_p()
+        Publisher.objects.create(name='Second Publisher')
+        self.assertIn('Second Publisher', ArticleForm().as_p())
+
+    def test_journalist_choices_use_username(self):
+        """Test that journalist options are labelled by username."""
+        choices = list(SubscriptionForm().fields['journalist'].choices)
+        self.assertIn((self.journalist.pk, 'journalist'), choices)
+
+    def test_journalist_choices_follow_role_changes(self):
+        """Test that promoting a user to journalist refreshes options."""
+        SubscriptionForm().as_p()
+        reader = User.objects.create_user(
+            username='promoted',
+            email='promoted@example.com',
+            password='testpass123',
+            role='reader'
+        )
+        self.assertNotIn('promoted', SubscriptionForm().as_p())
+        reader.role = 'journalist'
+        reader.save()
+        self.assertIn('promoted', SubscriptionForm().as_p())
+
+    def test_login_keeps_journalist_choices(self):
+        """Test that last_login updates do not invalidate options."""
+        SubscriptionForm().as_p()
+        self.client.force_login(self.journalist)
+        with self.assertNumQueries(0):
+            SubscriptionForm().as_p()
+
+    def test_cached_choices_still_validate(self):
+        """Test that submitted values are validated against the DB."""
+        form = SubscriptionForm(data={'publisher': self.publisher.pk})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['publisher'], self.publisher)
+
+    def test_choice_queryset_loads_label_only(self):
+        """Test that dropdown querysets defer all but pk and label."""
+        field = ArticleForm().fields['publisher']
+        deferred, _ = field.queryset.query.deferred_loading
+        self.assertEqual(set(deferred), {'id', 'name'})
+        self.assertEqual(field.label_from_instance(self.publisher),
+                         'Test Publisher')
+
+
+class QueuedEmailBackendTest(TestCase):
+    """
+    Test cases for background email delivery.
+    """
+    def test_messages_delivered_by_queue_backend(self):
+        """Test that queued messages reach the configured backend."""
+        with self.settings(
+            EMAIL_BACKEND='news.email_backends.QueuedEmailBackend',
+            EMAIL_QUEUE_BACKEND=(
+                'django.core.mail.backends.locmem.EmailBackend'
+            )
+        ):
+            sent = send_mail(
+                'Subject', 'Body', 'from@example.com', ['to@example.com']
+            )
+            email_backends.flush()
+        self.assertEqual(sent, 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, 'Subject')
 
 
 class PasswordResetTest(TestCase):
@@ -476,15 +1097,53 @@ class PasswordResetTest(TestCase):
     def test_reset_password_view_valid_token(self):
         """Test reset password view with valid token."""
         from news.models import PasswordResetToken
-        token = PasswordResetToken.objects.create(
-            user=self.user,
-            token='test-token-123'
-        )
+        _, raw_token = PasswordResetToken.create_for_user(self.user)
 
-        response = self.client.get(f'/reset-password/{token.token}/')
+        response = self.client.get(f'/reset-password/{raw_token}/')
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Reset Password')
 
+    def test_raw_token_is_not_stored(self):
+        """Test that only the hash of a reset token is persisted."""
+        from news.models import PasswordResetToken
+        token, raw_token = PasswordResetToken.create_for_user(self.user)
+        self.assertNotEqual(token.token_hash, raw_token)
+        self.assertEqual(
+            PasswordResetToken.get_by_token(raw_token).pk, token.pk
+        )
+
+    def test_expired_token_is_invalid(self):
+        """Test that tokens past expires_at are rejected."""
+        from news.models import PasswordResetToken
+        token, _ = PasswordResetToken.create_for_user(self.user)
+        self.assertTrue(token.is_valid())
+        token.expires_at = timezone.now()
+        self.assertFalse(token.is_valid())
+
+    def test_delete_stale_tokens(self):
+        """Test that used and expired tokens are cleaned up."""
+        from news.models import PasswordResetToken
+        active, _ = PasswordResetToken.create_for_user(self.user)
+        used, _ = PasswordResetToken.create_for_user(self.user)
+        used.is_used = True
+        used.save()
+        expired, _ = PasswordResetToken.create_for_user(self.user)
+        expired.expires_at = timezone.now()
+        expired.save()
+        self.assertEqual(PasswordResetToken.delete_stale(), 2)
+        self.assertQuerySetEqual(
+            PasswordResetToken.objects.all(), [active]
+        )
+
+    def test_reset_password_form_mismatch(self):
+        """Test that mismatched passwords, including non-ASCII, fail."""
+        form = ResetPasswordForm(data={
+            'new_password1': 'newpass123é',
+            'new_password2': 'newpass123e',
+        })
+        self.assertFalse(form.is_valid())
+        self.assertIn("Passwords don't match", form.non_field_errors())
+
     def test_reset_password_view_invalid_token(self):
         """Test reset password view with invalid token."""
         response = self.client.get('/reset-password/invalid-token/')
@@ -493,12 +1152,9 @@ class PasswordResetTest(TestCase):
     def test_reset_password_post_valid(self):
         """Test reset password POST with valid data."""
         from news.models import PasswordResetToken
-        token = PasswordResetToken.objects.create(
-            user=self.user,
-            token='test-token-123'
-        )
+        token, raw_token = PasswordResetToken.create_for_user(self.user)
 
-        response = self.client.post(f'/reset-password/{token.token}/', {
+        response = self.client.post(f'/reset-password/{raw_token}/', {
             'new_password1': 'newpass123',
             'new_password2': 'newpass123'
         })
@@ -2,6 +2,8 @@
 Views for news application with role-based access control.
 """
 
+import logging
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
@@ -17,6 +19,8 @@ from .forms import (
     ResetPasswordForm
 )
 
+logger = logging.getLogger(__name__)
+
 
 def home(request):
     """
@@ -33,9 +37,11 @@ def home(request):
         publishers context
     :rtype: HttpResponse
     """
+    # Author and publisher names are denormalized onto the article, so
+    # only the category is joined and the unused body is not loaded.
     articles = Article.objects.filter(
         status='published'
-    ).select_related('author', 'publisher', 'category')
+    ).select_related(None).select_related('category').defer('content')
 
     paginator = Paginator(articles, 10)
     page_number = request.GET.get('page')
@@ -221,7 +227,6 @@ def approve_article(request, pk):
         if form.is_valid():
             article = form.save(commit=False)
             article.approve(request.user)
-            article.save()
             messages.success(request, 'Article approved successfully')
             return redirect('news:article_detail', pk=article.pk)
     else:
@@ -344,7 +349,9 @@ def search_articles(request):
     category = request.GET.get('category', '')
     publisher = request.GET.get('publisher', '')
 
-    articles = Article.objects.filter(status='published')
+    articles = Article.objects.filter(
+        status='published'
+    ).select_related(None).select_related('category').defer('content')
 
     if query:
         articles = articles.filter(
@@ -355,6 +362,8 @@ def search_articles(request):
         articles = articles.filter(category__name=category)
 
     if publisher:
+        # Filter through the join: publisher.name has a unique index and
+        # article.publisher_id leads an index, unlike the copied name
         articles = articles.filter(publisher__name=publisher)
 
     paginator = Paginator(articles, 10)
@@ -381,15 +390,8 @@ def forgot_password(request):
             try:
                 user = User.objects.get(email=email)
 
-                # Generate token for password reset
-                import secrets
-                token = secrets.token_urlsafe(32)
-
-                # Create password reset token
-                PasswordResetToken.objects.create(
-                    user=user,
-                    token=token
-                )
+                # Create password reset token; only its hash is stored
+                _, token = PasswordResetToken.create_for_user(user)
 
                 # Send email with reset link
                 from django.core.mail import send_mail
@@ -409,7 +411,7 @@ def forgot_password(request):
                     )
                 except Exception as e:
                     # Log the error but don't expose it to the user
-                    print(f"Email sending failed: {e}")
+                    logger.error("Email sending failed: %s", e)
                     # Still show success message for security
 
                 messages.success(
@@ -434,7 +436,7 @@ def reset_password(request, token):
     Handle password reset with token.
     """
     try:
-        reset_token = PasswordResetToken.objects.get(token=token)
+        reset_token = PasswordResetToken.get_by_token(token)
 
         if not reset_token.is_valid():
             messages.error(request, 'Invalid or expired reset token.')
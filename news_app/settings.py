@@ -82,9 +82,13 @@ import os
 if os.getenv('DOCKER_ENV'):
     # Docker environment - use MySQL
     try:
-        import pymysql
-        pymysql.install_as_MySQLdb()
-        
+        try:
+            # Prefer the mysqlclient C driver
+            import MySQLdb  # noqa: F401
+        except ImportError:
+            import pymysql
+            pymysql.install_as_MySQLdb()
+
         DATABASES = {
             'default': {
                 'ENGINE': 'django.db.backends.mysql',
@@ -93,14 +97,20 @@ if os.getenv('DOCKER_ENV'):
                 'PASSWORD': 'newspassword',
                 'HOST': 'db',
                 'PORT': '3306',
+                # Reuse connections across requests instead of
+                # reconnecting every time
+                'CONN_MAX_AGE': 600,
+                'CONN_HEALTH_CHECKS': True,
+                # Strict mode is set on the server (see docker-compose.yml)
+                # rather than with a per-connection init_command
                 'OPTIONS': {
-                    'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
                     'charset': 'utf8mb4',
+                    'isolation_level': 'read committed',
                 },
             }
         }
     except ImportError:
-        # Fallback to SQLite if PyMySQL is not available
+        # Fallback to SQLite if no MySQL driver is available
         DATABASES = {
             'default': {
                 'ENGINE': 'django.db.backends.sqlite3',
@@ -117,6 +127,17 @@ else:
     }
 
 
+# Cache
+# Use Redis when REDIS_URL is set (Docker), otherwise the local memory cache
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -172,15 +193,22 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'news.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 # Email Configuration
+# Messages are sent from a background thread by EMAIL_QUEUE_BACKEND so
+# requests do not wait on delivery
 # For development, use console backend to avoid SMTP authentication issues
 # For production, configure with real SMTP credentials
+EMAIL_BACKEND = 'news.email_backends.QueuedEmailBackend'
 if DEBUG:
-    EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+    EMAIL_QUEUE_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 else:
-    EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    EMAIL_QUEUE_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
     EMAIL_HOST = 'smtp.gmail.com'
     EMAIL_PORT = 587
     EMAIL_USE_TLS = True
@@ -198,3 +226,36 @@ TWITTER_ENABLED = bool(TWITTER_BEARER_TOKEN)
 LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+# Logging
+# News app records are written to stderr from a background thread so
+# request threads never block on console output; the news app logs INFO.
+# The django logger keeps Django's default handlers (console while DEBUG,
+# mail_admins for server errors otherwise).
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '{levelname} {asctime} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            '()': 'news.log_handlers.QueuedStreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        # Never log SQL, even if DEBUG-level logging is enabled elsewhere
+        'django.db.backends': {
+            'level': 'WARNING',
+        },
+        'news': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}